@@ -58,7 +58,7 @@ class SQLAnalyzerApp(ctk.CTk):
         self._apply_theme_settings()
 
         self.scanner = DMLScanner()
-        self.analyzer = SyntaxAnalyzer()
+        self.analyzer = SyntaxAnalyzer(incremental=True)
 
         self.setup_colors()
         self.create_ui()
@@ -636,15 +636,16 @@ class SQLAnalyzerApp(ctk.CTk):
         self.after(100, self.adjust_panel_sizes)
 
     def highlight_error_line(self, error_message):
-        try:
-            if "Línea" in error_message:
-                line_str = error_message.split("Línea")[1].split(".")[0].strip()
-                line_num = int(line_str)
-                start_index = f"{line_num}.0"
-                self.sql_input.see(start_index)
-                self.sql_input.tag_add("error_line", start_index, f"{line_num}.end lineend")
-        except:
-            pass
+        start = getattr(error_message, 'start', None)
+        if start is not None:
+            start_index = self.sql_input.index(f"1.0 + {start} chars")
+        elif getattr(error_message, 'line', None) is not None:
+            start_index = f"{error_message.line}.0"
+        else:
+            return
+
+        self.sql_input.see(start_index)
+        self.sql_input.tag_add("error_line", f"{start_index} linestart", f"{start_index} lineend")
 
     def configure_status(self, state="normal"):
         if state == "success":
@@ -0,0 +1,51 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.analyzer_syntax import SyntaxAnalyzer, ParseContext
+from core.scanner_dml import scanner_engines
+from bench_parse_table import best_of
+from bench_token_type import build_script, statements
+from stress_threads import catalog, templates, snapshot
+
+def split_statements(analyzer, sql_query):
+    scan_result = scanner_engines['regex']().analyze_sql(sql_query)
+    return [(statement_type, statement_tokens, lexical_errors)
+            for statement_type, statement_tokens, lexical_errors in analyzer.segment_statements(scan_result['tokens'], scan_result['diagnostics'])]
+
+def parse_statements(analyzer, parts):
+    context = ParseContext(analyzer.error_handler, None)
+    for statement_type, statement_tokens, lexical_errors in parts:
+        analyzer._parse_statement(context, statement_tokens[:], statement_type, lexical_errors)
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    sql_query = build_script(lines)
+
+    table = SyntaxAnalyzer('regex', cache_entries=0, catalog=catalog, parser_backend='table')
+    generated = SyntaxAnalyzer('regex', cache_entries=0, catalog=catalog, parser_backend='generated')
+
+    scripts = [template.format(i) for template in templates + statements for i in range(23)]
+    for script in scripts:
+        for recover in (False, True):
+            assert snapshot(table.parse(script, recover=recover)) == snapshot(generated.parse(script, recover=recover)), script
+
+    table_time = best_of(lambda: table.parse(sql_query), repeat)
+    generated_time = best_of(lambda: generated.parse(sql_query), repeat)
+    statement_count = len(table.parse(sql_query)['results'])
+
+    parts = split_statements(table, sql_query)
+    table_parser_time = best_of(lambda: parse_statements(table, parts), repeat)
+    generated_parser_time = best_of(lambda: parse_statements(generated, parts), repeat)
+
+    print(f"lines: {lines}, statements: {statement_count}, parity checked on {len(scripts)} scripts")
+    print(f"table-driven: {table_time:.3f}s, {statement_count / table_time:,.0f} statements/s")
+    print(f"generated:    {generated_time:.3f}s, {statement_count / generated_time:,.0f} statements/s")
+    print(f"speedup: {table_time / generated_time:.2f}x")
+    print(f"parser only: {table_parser_time * 1e6 / statement_count:.1f} us -> {generated_parser_time * 1e6 / statement_count:.1f} us per statement "
+          f"({table_parser_time / generated_parser_time:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import grammar
+from core.analyzer_syntax import SyntaxAnalyzer
+from core.syntax_errors import SyntaxErrorHandler
+from bench_parse_table import best_of
+
+nested = "SELECT ANOMBRE FROM ALUMNOS WHERE ANUM IN (SELECT ANUM FROM INSCRITOS WHERE CALIFICACION >= {0}) AND GENERACION = '20{0}';"
+
+def load_cold(error_handler, cache_dir):
+    grammar.compiled_tables.clear()
+    return grammar.load_table(error_handler, cache_dir)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    error_handler = SyntaxErrorHandler()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        compile_time = best_of(lambda: grammar.compile_table(grammar.grammar, error_handler), repeat)
+        load_cold(error_handler, cache_dir)
+        disk_time = best_of(lambda: load_cold(error_handler, cache_dir), repeat)
+        assert load_cold(error_handler, cache_dir)['parse_table'] == grammar.compile_table(grammar.grammar, error_handler)['parse_table']
+    grammar.compiled_tables.clear()
+    grammar.load_table(error_handler)
+    memo_time = best_of(lambda: grammar.load_table(error_handler), repeat)
+    init_time = best_of(lambda: SyntaxAnalyzer('regex', cache_entries=0, catalog=[]), repeat)
+
+    analyzer = SyntaxAnalyzer('regex', cache_entries=0, catalog=[])
+    sql_query = '\n'.join(nested.format(i % 50) for i in range(count))
+    result = analyzer.parse(sql_query)
+    assert result['status'] == 'success', result.get('errors')
+    parse_time = best_of(lambda: analyzer.parse(sql_query), 5)
+
+    print(f"productions: {sum(len(productions) for productions in grammar.grammar.values())}, nonterminals: {len(grammar.grammar)}")
+    print(f"generate tables + parser:      {compile_time * 1e3:.2f} ms")
+    print(f"load from disk cache:          {disk_time * 1e3:.2f} ms ({compile_time / disk_time:.1f}x)")
+    print(f"in-process memo hit:           {memo_time * 1e6:.1f} us")
+    print(f"SyntaxAnalyzer():              {init_time * 1e3:.2f} ms")
+    print(f"{count} nested subquery statements: {parse_time:.3f}s")
+
+if __name__ == "__main__":
+    main()
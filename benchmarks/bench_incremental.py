@@ -0,0 +1,57 @@
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.scanner_dml import scanner_engines, IncrementalScanner
+from bench_scanner import build_script
+
+def timed(fn):
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed, result
+
+def edits(lines):
+    middle = len(lines) // 2
+    yield "same-length edit in the middle", middle, middle + 1, [lines[middle].replace('70', '80')]
+    yield "new identifier in the middle", middle, middle + 1, [lines[middle].replace('ANOMBRE', 'ANOMBRE2')]
+    yield "insert line near the top", 10, 10, ["SELECT ANOMBRE FROM ALUMNOS;"]
+    yield "delete line near the end", len(lines) - 10, len(lines) - 9, []
+
+def positions(result):
+    return [(token.line, token.column, token.start, token.value) for token in result['tokens']]
+
+def check_first_line(engine):
+    scripts = ["\n  a.b = 'q';", "  @\na.b = 'q';", "\n  a.b = 'q';", "  X;\nY;\nSELECT B FROM T;", "  SELECT B FROM T;"]
+    scanner = IncrementalScanner(engine)
+    for sql_query in scripts:
+        result = scanner.analyze_sql(sql_query)
+        assert positions(result) == positions(scanner_engines[engine]().analyze_sql(sql_query)), sql_query
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    engine = sys.argv[2] if len(sys.argv) > 2 else 'classic'
+    lines = build_script(size).split('\n')
+    check_first_line(engine)
+
+    scanner = IncrementalScanner(engine)
+    elapsed, _ = timed(lambda: scanner.analyze_sql('\n'.join(lines)))
+    print(f"lines: {len(lines)}, engine: {engine}")
+    print(f"initial load:                    {elapsed:.3f}s")
+
+    for name, start, stop, new_lines in edits(lines):
+        lines[start:stop] = new_lines
+        sql_query = '\n'.join(lines)
+        full, expected = timed(lambda: scanner_engines[engine]().analyze_sql(sql_query))
+        incremental, result = timed(lambda: scanner.analyze_sql(sql_query))
+        assert positions(result) == positions(expected)
+        print(f"{name:32} full {full:.3f}s, incremental {incremental:.4f}s ({full / incremental:.0f}x)")
+
+if __name__ == "__main__":
+    main()
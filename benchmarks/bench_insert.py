@@ -0,0 +1,41 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.analyzer_syntax import SyntaxAnalyzer
+from bench_parse_table import best_of
+
+rows = [
+    "INSERT INTO ALUMNOS VALUES ('{0}', 'NOMBRE {0}', '2020', {0});",
+    "INSERT INTO INSCRITOS VALUES ('{0}', '2010I', 9);",
+    "INSERT INTO MATERIAS VALUES ('M{0}', 'MATERIA', 4, 'ISC', {0});"
+]
+
+def build_dump(count):
+    return '\n'.join(rows[i % len(rows)].format(i % 30) for i in range(count))
+
+def generic(analyzer):
+    analyzer._parse_insert = lambda tokens, lexical_errors: None
+    return analyzer
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    sql_query = build_dump(count)
+
+    for cache_entries in (1024, 0):
+        fast = SyntaxAnalyzer('regex', cache_entries=cache_entries, catalog=[])
+        slow = generic(SyntaxAnalyzer('regex', cache_entries=cache_entries, catalog=[]))
+        fast_result = fast.parse(sql_query)
+        assert fast_result['status'] == 'success', fast_result['errors']
+        assert fast_result == slow.parse(sql_query)
+
+        slow_time = best_of(lambda: slow.parse(sql_query), repeat)
+        fast_time = best_of(lambda: fast.parse(sql_query), repeat)
+        print(f"statements: {count}, cache_entries: {cache_entries}")
+        print(f"  generic path: {slow_time:.3f}s, {count / slow_time:,.0f} statements/s")
+        print(f"  fast path:    {fast_time:.3f}s, {count / fast_time:,.0f} statements/s ({slow_time / fast_time:.2f}x)")
+
+if __name__ == "__main__":
+    main()
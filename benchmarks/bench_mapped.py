@@ -0,0 +1,65 @@
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.scanner_dml import scanner_engines
+from bench_scanner import build_script
+
+modes = ['read', 'stream', 'mapped', 'mapped-all']
+
+def scan(mode, path, engine):
+    scanner = scanner_engines[engine]()
+    if mode == 'read':
+        with open(path, encoding='utf-8', newline='') as fileobj:
+            return len(scanner.analyze_sql(fileobj.read())['tokens'])
+    if mode == 'stream':
+        with open(path, encoding='utf-8', newline='') as fileobj:
+            return sum(1 for _ in scanner.iter_tokens(fileobj))
+    if mode == 'mapped':
+        return sum(1 for _ in scanner.iter_file_tokens(path))
+    return len(scanner.analyze_file(path)['tokens'])
+
+def child(mode, path, engine):
+    start = time.perf_counter()
+    tokens = scan(mode, path, engine)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(tokens, elapsed, peak)
+
+def write_file(path, megabytes):
+    block = build_script(2000) + '\n'
+    with open(path, 'w', encoding='utf-8', newline='') as fileobj:
+        for _ in range(max(1, megabytes * 1024 * 1024 // len(block))):
+            fileobj.write(block)
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child(sys.argv[2], sys.argv[3], sys.argv[4])
+        return
+
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    engine = sys.argv[2] if len(sys.argv) > 2 else 'regex'
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'dump.sql')
+    try:
+        write_file(path, megabytes)
+        print(f"file: {os.path.getsize(path) / (1024 * 1024):.0f} MiB, engine: {engine}")
+        counts = set()
+        for mode in modes:
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode, path, engine],
+                                    check=True, capture_output=True, text=True).stdout.split()
+            tokens, elapsed, peak = int(output[0]), float(output[1]), int(output[2])
+            counts.add(tokens)
+            print(f"{mode:>10}: {elapsed:7.2f}s  {tokens} tokens  peak RSS {peak / 1024:,.0f} MiB")
+        assert len(counts) == 1
+    finally:
+        os.remove(path)
+        os.rmdir(directory)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.scanner_dml import scanner_engines, ParallelScanner
+from bench_scanner import build_script
+
+def timed(fn, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def scan(scanner, sql_query):
+    scanner.reset()
+    return scanner.analyze_sql(sql_query)
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    engine = sys.argv[3] if len(sys.argv) > 3 else 'classic'
+    repeat = 3
+    sql_query = build_script(lines)
+
+    sequential, expected = timed(lambda: scanner_engines[engine]().analyze_sql(sql_query), repeat)
+    expected_tokens = [tuple(token) for token in expected['tokens']]
+    print(f"lines: {lines}, tokens: {len(expected_tokens)}, engine: {engine}, cpus: {os.cpu_count()}")
+    print(f"sequential analyze_sql: {sequential:.3f}s")
+
+    for workers in range(1, max_workers + 1):
+        with ParallelScanner(engine, workers=workers) as scanner:
+            scan(scanner, sql_query)
+            elapsed, result = timed(lambda: scan(scanner, sql_query), repeat)
+        assert [tuple(token) for token in result['tokens']] == expected_tokens
+        assert result['identifiers'].items() == expected['identifiers'].items()
+        assert result['constants'].items() == expected['constants'].items()
+        print(f"workers {workers:2}: {elapsed:.3f}s ({sequential / elapsed:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.analyzer_syntax import SyntaxAnalyzer
+from bench_token_type import statements
+
+def build_queries(requests, distinct):
+    return [statements[i % len(statements)].format(i % distinct) for i in range(requests)]
+
+def run(analyzer, queries):
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    for sql_query in queries:
+        result = analyzer.parse(sql_query)
+        assert result['status'] == 'success', result.get('errors')
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    engine = sys.argv[3] if len(sys.argv) > 3 else 'regex'
+    queries = build_queries(requests, distinct)
+
+    uncached = run(SyntaxAnalyzer(engine, cache_entries=0), queries)
+    print(f"requests: {requests}, distinct statements: {len(set(queries))}, engine: {engine}")
+    print(f"no cache:    {uncached:.3f}s ({requests / uncached:,.0f} statements/s)")
+
+    for entries in (1024, len(statements) - 1):
+        analyzer = SyntaxAnalyzer(engine, cache_entries=entries)
+        elapsed = run(analyzer, queries)
+        stats = analyzer.parse_cache.stats()
+        print(f"cache {entries:5}: {elapsed:.3f}s ({requests / elapsed:,.0f} statements/s, {uncached / elapsed:.2f}x) "
+              f"hits {stats['hits']}, misses {stats['misses']}, evictions {stats['evictions']}, "
+              f"{stats['bytes'] / 1024:,.0f} KiB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.analyzer_syntax import SyntaxAnalyzer
+from bench_token_type import build_script
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+def sequential(analyzer, scripts):
+    results = []
+    for script in scripts:
+        worker = SyntaxAnalyzer(analyzer.scanner_engine, catalog=[])
+        results.append(worker.parse(script)['status'])
+    return results
+
+def fan_out(analyzer, scripts, workers, ordered):
+    results = [None] * len(scripts)
+    for index, result in analyzer.parse_many(scripts, workers=workers, ordered=ordered):
+        results[index] = result['status']
+    return results
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    lines = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+    scripts = [build_script(lines + index % 7) for index in range(files)]
+    analyzer = SyntaxAnalyzer('regex', catalog=[])
+
+    baseline, expected = timed(lambda: sequential(analyzer, scripts))
+    print(f"scripts: {files}, lines per script: ~{lines}, cpus: {os.cpu_count()}")
+    print(f"new analyzer per script: {baseline:.3f}s")
+
+    for workers in range(1, max_workers + 1):
+        for ordered in (True, False):
+            elapsed, result = timed(lambda: fan_out(analyzer, scripts, workers, ordered))
+            assert result == expected
+            order = "input order" if ordered else "completion order"
+            print(f"parse_many workers {workers:2} ({order:16}): {elapsed:.3f}s ({baseline / elapsed:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.analyzer_syntax import SyntaxAnalyzer
+from bench_token_type import build_script
+
+def dict_lookups(syntax_table, lookups):
+    stack = []
+    for X, K in lookups:
+        if X in syntax_table and K in syntax_table[X]:
+            production = syntax_table[X][K]
+            for symbol in reversed(production):
+                if symbol != 99:
+                    stack.append(symbol)
+        else:
+            for possible_K in [99, 199]:
+                if X in syntax_table and possible_K in syntax_table[X]:
+                    production = syntax_table[X][possible_K]
+                    for symbol in reversed(production):
+                        if symbol != 99:
+                            stack.append(symbol)
+                    break
+        del stack[:]
+
+def dense_lookups(parse_table, parse_rows, parse_width, lookups):
+    stack = []
+    for X, K in lookups:
+        entry = parse_table[parse_rows[X] + (K if K < parse_width else parse_width)]
+        if entry is not None:
+            stack.extend(entry[0])
+        del stack[:]
+
+def best_of(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    sql_query = build_script(lines)
+
+    analyzer = SyntaxAnalyzer('regex')
+    result = analyzer.parse(sql_query, trace='full')
+    assert result['status'] == 'success', result.get('errors')
+
+    lookups = []
+    for statement in result['results']:
+        for step in statement['steps']:
+            if not analyzer.error_handler.is_terminal(step['X']):
+                lookups.append((step['X'], step['K']))
+
+    dict_time = best_of(lambda: dict_lookups(analyzer.syntax_table, lookups), repeat)
+    dense_time = best_of(lambda: dense_lookups(analyzer.parse_table, analyzer.parse_rows, analyzer.parse_width, lookups), repeat)
+    parse_time = best_of(lambda: SyntaxAnalyzer.parse(analyzer, sql_query), 1)
+
+    print(f"lines: {lines}, production lookups: {len(lookups)}")
+    print(f"dict of dicts: {dict_time * 1e9 / len(lookups):.0f} ns/lookup, {len(lookups) / dict_time:,.0f} lookups/s")
+    print(f"dense table:   {dense_time * 1e9 / len(lookups):.0f} ns/lookup, {len(lookups) / dense_time:,.0f} lookups/s")
+    print(f"speedup: {dict_time / dense_time:.2f}x")
+    print(f"full parse: {parse_time:.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.analyzer_syntax import SyntaxAnalyzer
+from bench_token_type import statements
+
+broken = "SELECT ANOMBRE, FROM ALUMNOS WHERE CALIFICACION >= {0};"
+
+def build_statements(count, every):
+    parts = []
+    for i in range(count):
+        template = broken if i % every == every - 1 else statements[i % len(statements)]
+        parts.append(template.format(i % 50))
+    return parts
+
+def fix_one_at_a_time(analyzer, parts):
+    parts = list(parts)
+    runs = 0
+    while True:
+        runs += 1
+        result = analyzer.parse('\n'.join(parts))
+        if result['status'] == 'success':
+            return runs, runs - 1
+        failed = result['results'][-1]['statement_number'] - 1
+        parts[failed] = statements[0].format(0)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    every = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    parts = build_statements(count, every)
+    analyzer = SyntaxAnalyzer('regex', cache_entries=0, catalog=[])
+
+    start = time.perf_counter()
+    result = analyzer.parse('\n'.join(parts), recover=True)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    runs, fixed = fix_one_at_a_time(analyzer, parts)
+    repeated = time.perf_counter() - start
+
+    assert fixed == len(result['errors'])
+    print(f"statements: {count}, broken: {fixed}")
+    print(f"recover=True, one pass: {single:.3f}s, {len(result['errors'])} errors reported")
+    print(f"stop at first error:    {repeated:.3f}s over {runs} runs ({repeated / single:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.scanner_dml import scanner_engines
+
+statements = [
+    "SELECT ANOMBRE, GENERACION\nFROM ALUMNOS A, INSCRITOS I\nWHERE A.A# = I.A# AND I.SEMESTRE = '2010I'\nAND CALIFICACION >= 70;",
+    "INSERT INTO ALUMNOS VALUES('A{0}', 'NOMBRE {0}', '2010', 'M', {0});",
+    "SELECT ANOMBRE FROM ALUMNOS WHERE A# IN (SELECT A# FROM INSCRITOS WHERE M# = 'M{0}');",
+    "CREATE TABLE T{0}(A CHAR(2) NOT NULL, B NUMERIC(3), CONSTRAINT PK_T{0} PRIMARY KEY (A));"
+]
+
+def build_script(lines):
+    parts = []
+    count = 0
+    i = 0
+    while count < lines:
+        part = statements[i % len(statements)].format(i)
+        parts.append(part)
+        count += part.count('\n') + 1
+        i += 1
+    return '\n'.join(parts)
+
+def run(engine, sql_query, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        scanner = scanner_engines[engine]()
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        result = scanner.analyze_sql(sql_query)
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    sql_query = build_script(lines)
+
+    timings = {}
+    results = {}
+    for engine in scanner_engines:
+        timings[engine], results[engine] = run(engine, sql_query, repeat)
+        tokens = len(results[engine]['tokens'])
+        print(f"{engine:>8}: {timings[engine]:.3f}s  {tokens} tokens  {tokens / timings[engine]:,.0f} tokens/s")
+
+    expected = [(t.line, t.type, t.value, t.code) for t in results['classic']['tokens']]
+    for engine in scanner_engines:
+        if [(t.line, t.type, t.value, t.code) for t in results[engine]['tokens']] != expected:
+            print(f"{engine}: token stream differs from classic")
+
+    print(f"speedup regex/classic: {timings['classic'] / timings['regex']:.2f}x")
+
+if __name__ == "__main__":
+    main()
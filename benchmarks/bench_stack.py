@@ -0,0 +1,88 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.analyzer_syntax import SyntaxAnalyzer
+from bench_parse_table import best_of
+
+special_stack_patterns = [
+    [199],
+    [199, 201],
+    [199, 312],
+    [199, 201, 55],
+    [199, 201, 55, 312]
+]
+
+def legacy_simplify_stack(stack):
+    simplified = stack.copy()
+
+    i = 0
+    while i < len(simplified) - 3:
+        if (simplified[i:i+4] == [53, 201, 55, 312] or
+            simplified[i:i+3] == [53, 201, 55] or
+            simplified[i:i+2] == [53, 201]):
+            simplified = simplified[:i] + simplified[i+4:]
+            i = 0
+        else:
+            i += 1
+
+    return simplified
+
+def legacy_match_stack_pattern(stack, pattern):
+    if len(stack) < len(pattern):
+        return False
+
+    for i, symbol in enumerate(pattern):
+        if i >= len(stack) or stack[i] != symbol:
+            return False
+
+    return True
+
+def legacy_accepts(stack):
+    simplified = legacy_simplify_stack(stack)
+    return any(legacy_match_stack_pattern(simplified, pattern) for pattern in special_stack_patterns)
+
+def nested_query(depth, closed=True):
+    sql_query = "SELECT ANOMBRE FROM ALUMNOS WHERE ANUM IN ("
+    sql_query += "SELECT ANUM FROM INSCRITOS WHERE CALIFICACION >= 8 AND ANUM IN (" * (depth - 1)
+    sql_query += "SELECT ANUM FROM INSCRITOS"
+    if closed:
+        sql_query += ")" * depth
+    return sql_query + " AND SEMESTRE = '2010I';"
+
+def main():
+    depths = [int(arg) for arg in sys.argv[1:]] or [50, 100, 200, 400, 800]
+    analyzer = SyntaxAnalyzer('regex', cache_entries=0, catalog=[], max_nesting_depth=None)
+    eof_nullable = analyzer.eof_nullable
+
+    print("leftover stack at EOF: legacy simplify + patterns vs nullable-suffix check")
+    for depth in depths:
+        stack = [199] + [53, 201, 55, 312] * depth + [312]
+        nullable_stack = [199] + [201, 310, 312, 303] * depth + [312]
+        assert legacy_accepts(stack) and eof_nullable.issuperset(nullable_stack)
+        legacy_time = best_of(lambda: legacy_accepts(stack), 3)
+        linear_time = best_of(lambda: eof_nullable.issuperset(nullable_stack), 3)
+        print(f"  depth {depth:4d} ({len(stack):5d} symbols): {legacy_time * 1e3:9.3f} ms -> {linear_time * 1e6:7.1f} us")
+
+    print("nested subqueries, full parse (closed / unclosed with recover=True)")
+    for depth in depths:
+        closed = nested_query(depth)
+        unclosed = nested_query(depth, closed=False)
+        assert analyzer.parse(closed)['status'] == 'success'
+        assert analyzer.parse(unclosed, recover=True)['status'] == 'error'
+        closed_time = best_of(lambda: analyzer.parse(closed), 3)
+        unclosed_time = best_of(lambda: analyzer.parse(unclosed, recover=True), 3)
+        print(f"  depth {depth:4d}: {closed_time * 1e3:8.2f} ms ({closed_time * 1e6 / depth:6.1f} us/level), "
+              f"unclosed {unclosed_time * 1e3:8.2f} ms ({unclosed_time * 1e6 / depth:6.1f} us/level)")
+
+    limited = SyntaxAnalyzer('regex', cache_entries=0, catalog=[])
+    print(f"max_nesting_depth={limited.max_nesting_depth}: fail fast on the first level past the limit")
+    for depth in depths:
+        sql_query = nested_query(depth)
+        result = limited.parse(sql_query)
+        limited_time = best_of(lambda: limited.parse(sql_query), 3)
+        print(f"  depth {depth:4d}: {limited_time * 1e3:8.2f} ms, {result['errors'][0] if result['errors'] else result['status']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.analyzer_syntax import SyntaxAnalyzer
+from core.scanner_dml import scanner_engines
+from core.syntax_errors import SyntaxErrorHandler
+
+statements = [
+    "SELECT ANOMBRE, GENERACION\nFROM ALUMNOS A, INSCRITOS I\nWHERE A.ANUM = I.ANUM AND I.SEMESTRE = '2010I'\nAND CALIFICACION >= {0};",
+    "SELECT DISTINCT ANOMBRE FROM ALUMNOS WHERE CALIFICACION >= {0} AND NOMBRE = 'N{0}';",
+    "SELECT ANOMBRE FROM ALUMNOS WHERE PROMEDIO < {0} OR CARRERA = 'ISC';"
+]
+
+def build_script(lines):
+    parts = []
+    count = 0
+    i = 0
+    while count < lines:
+        part = statements[i % len(statements)].format(i % 50)
+        parts.append(part)
+        count += part.count('\n') + 1
+        i += 1
+    return '\n'.join(parts)
+
+def legacy_get_token_type(self, token_info):
+    code = token_info.code
+
+    if (code >= 400 and code < 500):
+        return 4
+
+    if (code >= 600 and code < 750):
+        token_value = token_info.value
+        if token_value.startswith("'") and token_value.endswith("'"):
+            return 62
+        else:
+            try:
+                float(token_value)
+                return 61
+            except:
+                return 62
+
+    return code
+
+def counting(get_token_type, counter):
+    def wrapper(self, token_info):
+        counter[0] += 1
+        return get_token_type(self, token_info)
+    return wrapper
+
+def validate(sql_query, get_token_type, repeat):
+    original = SyntaxErrorHandler.get_token_type
+    SyntaxErrorHandler.get_token_type = get_token_type
+    try:
+        best = None
+        for _ in range(repeat):
+            analyzer = SyntaxAnalyzer('regex')
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            result = analyzer.parse(sql_query)
+            elapsed = time.perf_counter() - start
+            gc.enable()
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+    finally:
+        SyntaxErrorHandler.get_token_type = original
+
+def classify(tokens, get_token_type, rounds):
+    handler = SyntaxErrorHandler()
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for token in tokens:
+                get_token_type(handler, token)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / (rounds * len(tokens))
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    sql_query = build_script(lines)
+
+    counter = [0]
+    validate(sql_query, counting(SyntaxErrorHandler.get_token_type, counter), 1)
+    calls = counter[0]
+
+    legacy_time, legacy_result = validate(sql_query, legacy_get_token_type, repeat)
+    current_time, current_result = validate(sql_query, SyntaxErrorHandler.get_token_type, repeat)
+    assert legacy_result == current_result
+    assert current_result['status'] == 'success', current_result.get('errors')
+
+    scanned = scanner_engines['regex']().analyze_sql(sql_query)['tokens']
+    tokens = len(scanned)
+    print(f"lines: {lines}, tokens: {tokens}, get_token_type calls: {calls}")
+    print(f"get_token_type before: {classify(scanned, legacy_get_token_type, 10) * 1e9:.1f} ns/call")
+    print(f"get_token_type after:  {classify(scanned, SyntaxErrorHandler.get_token_type, 10) * 1e9:.1f} ns/call")
+    print(f"before (code ranges + float()): {legacy_time:.3f}s, {legacy_time * 1e9 / tokens:.0f} ns/token")
+    print(f"after (Token.kind):             {current_time:.3f}s, {current_time * 1e9 / tokens:.0f} ns/token")
+    print(f"speedup: {legacy_time / current_time:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.scanner_dml import RegexDMLScanner
+from bench_scanner import build_script
+
+def measure(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tokens = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tokens, after - before
+
+def read_values(tokens):
+    start = time.perf_counter()
+    for token in tokens:
+        token[1][1]
+    indexed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for token in tokens:
+        token.value
+    attribute = time.perf_counter() - start
+    return indexed, attribute
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    scan_result = RegexDMLScanner().analyze_sql(build_script(lines))
+    source = scan_result['tokens']
+
+    tokens, token_bytes = measure(lambda: [type(t)(t.line, t.type, t.value, t.code, t.extra) for t in source])
+    legacy, legacy_bytes = measure(lambda: [(t.line, (t.type, t.value, t.code, t.extra)) for t in source])
+
+    count = len(source)
+    print(f"tokens: {count}")
+    print(f"tuple (line, (type, value, code, extra)): {legacy_bytes / count:.1f} bytes/token")
+    print(f"Token (__slots__):                       {token_bytes / count:.1f} bytes/token")
+
+    indexed, attribute = read_values(tokens)
+    legacy_indexed = time.perf_counter()
+    for token in legacy:
+        token[1][1]
+    legacy_indexed = time.perf_counter() - legacy_indexed
+    print(f"value read, tuple token[1][1]: {legacy_indexed * 1e9 / count:.1f} ns/token")
+    print(f"value read, Token.value:       {attribute * 1e9 / count:.1f} ns/token")
+    print(f"value read, Token[1][1]:       {indexed * 1e9 / count:.1f} ns/token")
+
+if __name__ == "__main__":
+    main()
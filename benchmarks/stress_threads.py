@@ -0,0 +1,96 @@
+import copy
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.analyzer_syntax import SyntaxAnalyzer
+
+catalog = [
+    {'name': 'ALUMNOS', 'attributes': [
+        {'name': 'ANUM', 'type': 'CHAR', 'size': 5, 'not_null': True},
+        {'name': 'ANOMBRE', 'type': 'VARCHAR', 'size': 30, 'not_null': False},
+        {'name': 'GENERACION', 'type': 'CHAR', 'size': 4, 'not_null': False},
+        {'name': 'PROMEDIO', 'type': 'NUMERIC', 'size': 3, 'not_null': False}],
+     'constraints': []},
+    {'name': 'INSCRITOS', 'attributes': [
+        {'name': 'ANUM', 'type': 'CHAR', 'size': 5, 'not_null': True},
+        {'name': 'SEMESTRE', 'type': 'CHAR', 'size': 5, 'not_null': False},
+        {'name': 'CALIFICACION', 'type': 'NUMERIC', 'size': 3, 'not_null': False}],
+     'constraints': []}
+]
+
+templates = [
+    "SELECT ANOMBRE, GENERACION\nFROM ALUMNOS A, INSCRITOS I\nWHERE A.ANUM = I.ANUM AND I.SEMESTRE = '2010I'\nAND CALIFICACION >= {0};",
+    "SELECT ANOMBRE FROM ALUMNOS WHERE PROMEDIO < {0} OR GENERACION = '20{0}';",
+    "SELECT ANOMBRE FROM ALUMNOS WHERE PROMEDIO = 'X{0}';",
+    "SELECT ANOMBRE FROM PROFESORES WHERE PROMEDIO > {0};",
+    "SELECT ANOMBRE, FROM ALUMNOS WHERE PROMEDIO > {0};",
+    "SELECT ANOMBRE FROM ALUMNOS WHERE PROMEDIO >;",
+    "INSERT INTO ALUMNOS VALUES ('{0}', 'NOMBRE', '2020', {0});",
+    "INSERT INTO ALUMNOS VALUES ('{0}' 'NOMBRE');",
+    "\n\n  SELECT ANOMBRE\n  FROM ALUMNOS\n  WHERE ANUM = '{0}';\nSELECT ANOMBRE FROM INSCRITOS WHERE SEMESTRE ="
+]
+
+traces = ['off', 'off', 'errors', 'full']
+
+def snapshot(result):
+    errors = [(str(error), error.code, error.line, error.column, error.start, error.end)
+              for error in result.get('errors', [])]
+    statements = []
+    for statement in result.get('results', []):
+        statements.append((statement['status'], statement.get('statement_number'), [str(error) for error in statement['errors']],
+                           [(step['X'], step['K'], step['stack'], step['context'], step['action']) for step in statement.get('steps', [])]))
+    return result['status'], result['message'], errors, statements
+
+def build_jobs(count):
+    jobs = []
+    for index in range(count):
+        sql_query = templates[index % len(templates)].format(index % 23)
+        jobs.append((sql_query, traces[(index // len(templates)) % len(traces)]))
+    return jobs
+
+def expected_results(jobs, engine):
+    expected = {}
+    for job in set(jobs):
+        analyzer = SyntaxAnalyzer(engine, cache_entries=0, catalog=copy.deepcopy(catalog))
+        expected[job] = snapshot(analyzer.parse(job[0], job[1]))
+    return expected
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    engine = sys.argv[3] if len(sys.argv) > 3 else 'regex'
+    sys.setswitchinterval(1e-6)
+
+    jobs = build_jobs(len(templates) * len(traces) * 23)
+    expected = expected_results(jobs, engine)
+    analyzer = SyntaxAnalyzer(engine, catalog=copy.deepcopy(catalog))
+
+    def run(seed):
+        shuffled = jobs[:]
+        random.Random(seed).shuffle(shuffled)
+        return [(job, snapshot(analyzer.parse(job[0], job[1]))) for job in shuffled]
+
+    start = time.perf_counter()
+    mismatches = 0
+    parses = 0
+    with ThreadPoolExecutor(threads) as pool:
+        for results in pool.map(run, range(threads * rounds)):
+            for job, result in results:
+                parses += 1
+                if result != expected[job]:
+                    mismatches += 1
+                    if mismatches <= 3:
+                        print(f"mismatch for {job!r}:\n  got      {result}\n  expected {expected[job]}")
+    elapsed = time.perf_counter() - start
+
+    print(f"threads: {threads}, parses: {parses}, mismatches: {mismatches}, {elapsed:.2f}s, cache {analyzer.parse_cache.stats()}")
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
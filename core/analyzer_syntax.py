@@ -1,87 +1,89 @@
-from core.scanner_dml import DMLScanner;
+import copy;
+import os;
+import sys;
+import threading;
+from collections import OrderedDict, deque;
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED;
+from itertools import count, islice;
+from core.scanner_dml import scanner_engines, IncrementalScanner, Token, fingerprint;
 from core.syntax_errors import SyntaxErrorHandler;
+from core.syntax_tree import build_tree;
+from core.grammar import load_table;
 from core.analyzer_semantic import DDLSemanticAnalyzer;
 from core.db_connector import DBConnector;
 
-class SyntaxAnalyzer:
-    def __init__(self):
-        self.error_handler = SyntaxErrorHandler()
-
-        self.syntax_table = {
-            200: {16: [16,17,4,52,202,53,55,201]},
-            201: {16: [200], 27: [211], 10: [300], 199: [99]},
-            202: {4: [4,203,216,204,217,205]},
-            203: {18: [18], 19: [19], 4: [4]},
-            204: {20: [20, 21], 50: [99], 24: [99], 53: [99]},
-            205: {50: [50, 206], 53: [99]},
-            206: {4: [202], 22: [207]},
-            207: {22: [22,4,208,52,218,53,209]},
-            208: {24: [24, 23], 25: [25, 23]},
-            209: {26: [26,4,52,4,53,210], 50: [50, 207], 53: [99]},
-            210: {50: [50, 207], 53: [99]},
-            211: {27: [27,28,4,29,52,212,53,55,215]},
-            212: {54: [213,214], 61: [213, 214], 62: [213, 214]},
-            213: {54: [54,62,54], 61: [61], 62: [62]},
-            214: {50: [50, 212], 53: [99]},
-            215: {27: [211], 16: [200], 10: [300], 199: [99]},
-            216: {52: [52,61,53], 24: [99], 50: [99], 53: [99]},
-            217: {24: [24, 23], 50: [99], 53: [99]},
-            218: {4: [4,219]},
-            219: {50: [50,4,219], 53: [99]},
-            300: {10: [10, 320, 301, 11, 306, 310, 55, 201]},
-            320: {30: [30], 4: [99], 72: [99]},
-            301: {4: [302], 72: [72, 303]},
-            302: {4: [304, 303]},
-            303: {11: [99], 12: [99], 50: [50, 302], 53: [99], 199: [99]},
-            304: {4: [4, 305]},
-            305: {8: [99], 11: [99], 12: [99], 13: [99], 14: [99], 15: [99],
-                 50: [99], 51: [51, 4], 53: [99], 54: [99],
-                 81: [99], 82: [99], 83: [99], 84: [99], 85: [99], 86: [99], 199: [99]},
-            306: {4: [308, 307]},
-            307: {12: [99], 50: [50, 306], 53: [99], 199: [99]},
-            308: {4: [4, 309]},
-            309: {4: [4], 12: [99], 50: [99], 53: [99], 199: [99]},
-            310: {12: [12, 311], 53: [99], 199: [99]},
-            311: {4: [313, 312], 61: [319, 312], 62: [318, 312], 14: [14, 311], 15: [15, 311]},
-            312: {14: [317, 311], 15: [317, 311], 53: [99], 199: [99], 4: [99]},
-            313: {4: [304, 314]},
-            314: {13: [13, 52, 300, 53],
-                  81: [315, 316],
-                  82: [315, 316],
-                  83: [315, 316],
-                  84: [315, 316],
-                  85: [315, 316],
-                  86: [315, 316],
-                  53: [99],
-                  14: [99],
-                  15: [99]
-                 },
-            315: {81: [81], 82: [82], 83: [83], 84: [84], 85: [85], 86: [86]},
-            316: {4: [304], 54: [54, 318, 54], 61: [319], 62: [318], 6: [319], 53: [99], 14: [99], 15: [99]},
-            317: {14: [14], 15: [15]},
-            318: {61: [319], 62: [62], 53: [99], 14: [99], 15: [99]},
-            319: {61: [61], 53: [99], 14: [99], 15: [99]}
-        }
-
-        self.scanner = DMLScanner()
-        self.semantic_analyzer = DDLSemanticAnalyzer()
-
-        self.stack = []
-        self.errors = []
-        self.tokens = []
-        self.current_token_index = 0
-
-        self.current_context = None
-        self.analysis_path = []
-        self.prev_token = None
-        self.prev_token_type = None
-        self.last_id_token = None
-
-        self.tables_info = []
-
-        self.db_connector = DBConnector()
+catalog_versions = count(1)
+
+def estimate_size(value):
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key) + estimate_size(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += estimate_size(item)
+    return size
+
+class ParseCache:
+    def __init__(self, max_entries=1024, max_bytes=16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        size = estimate_size(key) + estimate_size(value)
+        with self.lock:
+            if self.max_entries <= 0 or size > self.max_bytes:
+                return
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self.entries[key] = (value, size)
+            self.size += size
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self):
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
 
-        self.update_semantic_tables()
+class ParseContext:
+    def __init__(self, error_handler, scanner, trace='off', trace_steps=50, recover=False):
+        self.error_handler = error_handler
+        self.scanner = scanner
+        self.trace = trace
+        self.trace_steps = trace_steps
+        self.recover = recover
+        self.trace_buffer = []
+        self.reset()
 
     def reset(self):
         self.stack = []
@@ -89,14 +91,13 @@ class SyntaxAnalyzer:
         self.tokens = []
         self.current_token_index = 0
         self.current_context = None
-        self.analysis_path = []
+        self.outer_context = None
+        self.nesting = []
         self.prev_token = None
         self.prev_token_type = None
         self.last_id_token = None
 
     def update_context(self, X, K=None):
-        self.analysis_path.append((X, K))
-
         if self.error_handler.is_terminal(X) and X != 99 and X != 199:
             self.prev_token = X
             self.prev_token_type = X
@@ -105,6 +106,7 @@ class SyntaxAnalyzer:
                 self.last_id_token = self.current_token_index
 
             if X == 13:
+                self.outer_context = self.current_context
                 self.current_context = 'IN_SUBQUERY'
             elif X == 52:
                 if self.current_context == 'IN_SUBQUERY':
@@ -161,151 +163,269 @@ class SyntaxAnalyzer:
         elif X in self.error_handler.operadores_relacionales:
             self.last_id_token = None
 
-    def parse(self, sql_query):
+class SyntaxAnalyzer:
+    def __init__(self, scanner_engine='classic', incremental=False, cache_entries=1024, cache_bytes=16 * 1024 * 1024,
+                 catalog=None, parser_backend='table', max_nesting_depth=256, max_statement_tokens=100000):
+        if parser_backend not in ('table', 'generated'):
+            raise ValueError(f"Motor de análisis no válido: {parser_backend}")
+        self.error_handler = SyntaxErrorHandler()
 
-        forbidden_error = self.error_handler.check_forbidden_characters(sql_query)
-        if forbidden_error:
-            return {
-                "status": "error",
-                "message": "Se encontraron caracteres no permitidos",
-                "errors": [forbidden_error],
-                "steps": []
-            }
+        compiled = load_table(self.error_handler)
+        self.syntax_table = compiled['syntax_table']
+        self.parse_table = compiled['parse_table']
+        self.parse_rows = compiled['parse_rows']
+        self.parse_width = compiled['parse_width']
+        self.follow_sets = compiled['follow_sets']
+        self.eof_nullable = compiled['eof_nullable']
+        self.parser_backend = parser_backend
+        self.max_nesting_depth = max_nesting_depth
+        self.max_statement_tokens = max_statement_tokens
+        self.recognizers = compiled['recognizers'] if parser_backend == 'generated' else None
+
+        self.scanner_engine = scanner_engine
+        self.incremental = incremental
+        if incremental:
+            self.scanner = IncrementalScanner(scanner_engine)
+        self.semantic_analyzer = DDLSemanticAnalyzer()
+        self.parse_cache = ParseCache(cache_entries, cache_bytes)
 
-        scan_result = self.scanner.analyze_sql(sql_query)
-        tokens = scan_result['tokens']
+        self.scanner_lock = threading.Lock()
+        self.catalog_lock = threading.RLock()
+        self.tables_info = []
 
-        if not tokens:
-            return {"status": "error", "message": "No hay tokens para analizar", "errors": [], "steps": []}
+        self.db_connector = DBConnector()
 
-        current_statement_tokens = []
+        if catalog is None:
+            self.update_semantic_tables()
+        else:
+            self.tables_info = catalog
+
+    @property
+    def tables_info(self):
+        return self._tables_info
+
+    @tables_info.setter
+    def tables_info(self, tables):
+        with self.catalog_lock:
+            self._tables_info = tables
+            self.catalog_version = next(catalog_versions)
+
+    def parse(self, sql_query, trace='off', trace_steps=50, recover=False):
+        if trace not in ('off', 'errors', 'full'):
+            raise ValueError(f"Nivel de traza no válido: {trace}")
+
+        if self.incremental:
+            with self.scanner_lock:
+                return self._parse(ParseContext(self.error_handler, self.scanner, trace, trace_steps, recover), sql_query)
+        return self._parse(ParseContext(self.error_handler, scanner_engines[self.scanner_engine](), trace, trace_steps, recover),
+                           sql_query)
+
+    def _parse(self, context, sql_query):
+        if isinstance(sql_query, str):
+            scan_result = context.scanner.analyze_sql(sql_query)
+            diagnostics = scan_result['diagnostics']
+            if diagnostics['forbidden_line'] is not None:
+                return self._forbidden_result(diagnostics)
+            
+            tokens = scan_result['tokens']
+
+            if not tokens:
+                return {"status": "error", "message": "No hay tokens para analizar", "errors": [], "steps": []}
+        else:
+            tokens = context.scanner.iter_tokens(sql_query)
+            diagnostics = context.scanner.diagnostics
+        
         statement_count = 0
         results = []
+        collected = []
 
-        i = 0
-        while i < len(tokens):
-            token_info = tokens[i]
-            token_type = self.error_handler.get_token_type(token_info)
-            token_value = token_info[1][1].upper() if token_info[1][1] else ""
-
-            is_new_statement = False
-
-            if token_type == 55 and current_statement_tokens:
-                current_statement_tokens.append(token_info)
-                statement_count += 1
-
-                first_token = current_statement_tokens[0]
-                first_token_value = first_token[1][1].upper()
-
-                statement_type = "SELECT"
-                if first_token_value == "CREATE":
-                    statement_type = "CREATE"
-                elif first_token_value == "INSERT":
-                    statement_type = "INSERT"
-
-                result = self._parse_statement(current_statement_tokens, statement_type)
-                result['statement_number'] = statement_count
-                results.append(result)
-
-                if result['status'] == 'success':
-                    semantic_result = None
-
-                    attribute_validation = self.error_handler.validate_attribute_names(current_statement_tokens)
-                    if attribute_validation:
-                        semantic_result = attribute_validation
-
-                    elif statement_type == "CREATE":
-                        constraint_validation = self.error_handler.validate_create_table_constraints(current_statement_tokens)
-                        if constraint_validation:
-                            semantic_result = constraint_validation
-                        else:
-                            table_analysis_result = self._analyze_create_table(current_statement_tokens)
-                            if table_analysis_result:
-                                semantic_result = table_analysis_result
-                    elif statement_type == "SELECT":
-                        if self.tables_info:
-                            validations = [
-                                lambda: self.error_handler.validate_where_conditions(current_statement_tokens, self.tables_info),
-                                lambda: self.error_handler.validate_type_conversions(current_statement_tokens, self.tables_info),
-                                lambda: self.error_handler.validate_select_tables(current_statement_tokens, self.tables_info),
-                                lambda: self.error_handler.validate_select_columns(current_statement_tokens, self.tables_info)
-                            ]
-
-                            for validate_fn in validations:
-                                validation_result = validate_fn()
-                                if validation_result:
-                                    semantic_result = validation_result
-                                    break
-
-                    if semantic_result:
-                        semantic_result['steps'] = result['steps']
-                        semantic_result['statement_number'] = statement_count
-                        semantic_result['statement_tokens'] = current_statement_tokens
-                        results[-1] = semantic_result
-
-                        error_msgs = [f"Sentencia {statement_count}: {error}" for error in semantic_result['errors']]
-                        return {
-                            "status": "error",
-                            "message": "Se encontró un error semántico",
-                            "errors": error_msgs,
-                            "results": results
-                        }
-
-                elif result['status'] == 'error':
-                    error_msgs = [f"Sentencia {statement_count}: {error}" for error in result['errors']]
+        for statement_type, statement_tokens, lexical_errors in self.segment_statements(tokens, diagnostics):
+            terminated = len(statement_tokens) > 1 and self.error_handler.get_token_type(statement_tokens[-1]) == 55
+            if diagnostics['forbidden_line'] is not None and not terminated:
+                break
+            statement_count += 1
+
+            result, semantic_result = self._analyze_statement(context, statement_tokens, statement_type, lexical_errors)
+            result['statement_number'] = statement_count
+            results.append(result)
+
+            failure = None
+            if result['status'] == 'success':
+                if semantic_result:
+                    semantic_result['steps'] = self._semantic_steps(context, result)
+                    semantic_result['statement_number'] = statement_count
+                    semantic_result['statement_tokens'] = statement_tokens
+                    results[-1] = semantic_result
+                    failure = ("Se encontró un error semántico", semantic_result)
+            elif result['status'] == 'error':
+                failure = ("Se encontró un error sintáctico", result)
+
+            if failure:
+                error_msgs = [error.with_prefix(f"Sentencia {statement_count}: ") for error in failure[1]['errors']]
+                if not context.recover:
                     return {
                         "status": "error",
-                        "message": "Se encontró un error sintáctico",
+                        "message": failure[0],
                         "errors": error_msgs,
                         "results": results
                     }
+                collected.extend(error_msgs)
 
-                current_statement_tokens = []
-                is_new_statement = True
+        if diagnostics['forbidden_line'] is not None:
+            if not collected:
+                return self._forbidden_result(diagnostics)
+            collected.extend(self._forbidden_result(diagnostics)['errors'])
 
-            if not is_new_statement:
-                current_statement_tokens.append(token_info)
-
-            i += 1
+        if not statement_count:
+            return {"status": "error", "message": "No hay tokens para analizar", "errors": [], "steps": []}
 
-        if current_statement_tokens:
-            statement_count += 1
+        if collected:
+            return {
+                "status": "error",
+                "message": f"Se encontraron {len(collected)} errores",
+                "errors": collected,
+                "results": results
+            }
 
-            first_token = current_statement_tokens[0]
-            first_token_value = first_token[1][1].upper()
+        return {
+            'status': 'success',
+            'message': 'Análisis de SQL completado exitosamente',
+            'errors': [],
+            'results': results
+        }
 
-            statement_type = "SELECT"
-            if first_token_value == "CREATE":
-                statement_type = "CREATE"
-            elif first_token_value == "INSERT":
-                statement_type = "INSERT"
+    def segment_statements(self, tokens, diagnostics):
+        malformed_strings = diagnostics['malformed_strings']
+        consecutive_constants = diagnostics['consecutive_constants']
+        malformed_index = 0
+        constants_index = 0
+        lexical_errors = [None, None]
+        statement_tokens = []
+        max_statement_tokens = self.max_statement_tokens
+        skipping = False
 
-            result = self._parse_statement(current_statement_tokens, statement_type)
-            result['statement_number'] = statement_count
-            results.append(result)
+        for token_info in tokens:
+            if malformed_index < len(malformed_strings) and token_info is malformed_strings[malformed_index]:
+                malformed_index += 1
+                if lexical_errors[0] is None and not skipping:
+                    lexical_errors[0] = token_info
+            if constants_index < len(consecutive_constants) and token_info is consecutive_constants[constants_index]:
+                constants_index += 1
+                if lexical_errors[1] is None and not skipping:
+                    lexical_errors[1] = token_info
+
+            if skipping:
+                if self.error_handler.get_token_type(token_info) == 55:
+                    skipping = False
+                continue
+
+            statement_tokens.append(token_info)
+            if self.error_handler.get_token_type(token_info) == 55 and len(statement_tokens) > 1:
+                yield self._statement_type(statement_tokens[0]), statement_tokens, lexical_errors
+                statement_tokens = []
+                lexical_errors = [None, None]
+            elif max_statement_tokens is not None and len(statement_tokens) > max_statement_tokens:
+                yield self._statement_type(statement_tokens[0]), statement_tokens, lexical_errors
+                statement_tokens = []
+                lexical_errors = [None, None]
+                skipping = True
+
+        if statement_tokens:
+            yield self._statement_type(statement_tokens[0]), statement_tokens, lexical_errors
+
+    def _statement_type(self, first_token):
+        first_token_value = first_token.value.upper()
+        if first_token_value == "CREATE":
+            return "CREATE"
+        if first_token_value == "INSERT":
+            return "INSERT"
+        return "SELECT"
+
+    def parse_many(self, scripts, workers=None, ordered=True, batch_size=8, trace='off', trace_steps=50, recover=False):
+        if trace not in ('off', 'errors', 'full'):
+            raise ValueError(f"Nivel de traza no válido: {trace}")
+        workers = workers or os.cpu_count() or 1
+        scripts = enumerate(scripts)
+        settings = (self.scanner_engine, copy.deepcopy(self.tables_info), self.parse_cache.max_entries, self.parse_cache.max_bytes,
+                    self.parser_backend, self.max_nesting_depth, self.max_statement_tokens)
+
+        if workers < 2:
+            batch_worker = BatchWorker(*settings)
+            for item in scripts:
+                yield from batch_worker.parse([item], trace, trace_steps, recover)
+            return
+
+        pool = ProcessPoolExecutor(workers, initializer=init_worker, initargs=settings)
+        try:
+            pending = deque() if ordered else set()
+            while True:
+                batch = list(islice(scripts, batch_size))
+                if batch:
+                    future = pool.submit(parse_batch, batch, trace, trace_steps, recover)
+                    if ordered:
+                        pending.append(future)
+                    else:
+                        pending.add(future)
 
-            if result['status'] == 'success':
-                semantic_result = None
+                if pending and (not batch or len(pending) >= workers * 2):
+                    if ordered:
+                        yield from pending.popleft().result()
+                    else:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield from future.result()
 
-                attribute_validation = self.error_handler.validate_attribute_names(current_statement_tokens)
+                if not batch and not pending:
+                    break
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def _analyze_statement(self, context, tokens, statement_type, lexical_errors):
+        if self.max_statement_tokens is not None and len(tokens) > self.max_statement_tokens:
+            token_info = tokens[self.max_statement_tokens]
+            error_msg = self.error_handler.format_error_message(
+                209, token_info.line, f"La sentencia excede el límite de {self.max_statement_tokens} tokens.", token_info.span)
+            return {"status": "error", "message": "Se encontraron errores sintácticos",
+                    "errors": [error_msg], "steps": []}, None
+
+        if statement_type == "INSERT" and context.trace == 'off':
+            result = self._parse_insert(tokens, lexical_errors)
+            if result is not None:
+                return result, None
+
+        shape = self._cache_shape(context, tokens, statement_type, lexical_errors)
+        if shape is not None:
+            with self.catalog_lock:
+                key = (shape, self.catalog_version if self.tables_info else None)
+            outcome = self.parse_cache.get(key)
+            if outcome is not None:
+                return self._cached_outcome(outcome, tokens)
+
+        result = self._parse_statement(context, tokens, statement_type, lexical_errors)
+        semantic_result = None
+
+        with self.catalog_lock:
+            if result['status'] == 'success' and statement_type != "INSERT":
+                tree = build_tree(tokens)
+                attribute_validation = self.error_handler.validate_attribute_names(tokens, tree)
                 if attribute_validation:
                     semantic_result = attribute_validation
 
                 elif statement_type == "CREATE":
-                    constraint_validation = self.error_handler.validate_create_table_constraints(current_statement_tokens)
+                    constraint_validation = self.error_handler.validate_create_table_constraints(tokens, tree)
                     if constraint_validation:
                         semantic_result = constraint_validation
                     else:
-                        table_analysis_result = self._analyze_create_table(current_statement_tokens)
+                        table_analysis_result = self._analyze_create_table(tokens, tree)
                         if table_analysis_result:
                             semantic_result = table_analysis_result
                 elif statement_type == "SELECT":
                     if self.tables_info:
                         validations = [
-                            lambda: self.error_handler.validate_where_conditions(current_statement_tokens, self.tables_info),
-                            lambda: self.error_handler.validate_type_conversions(current_statement_tokens, self.tables_info),
-                            lambda: self.error_handler.validate_select_tables(current_statement_tokens, self.tables_info),
-                            lambda: self.error_handler.validate_select_columns(current_statement_tokens, self.tables_info)
+                            lambda: self.error_handler.validate_where_conditions(tokens, self.tables_info, tree),
+                            lambda: self.error_handler.validate_type_conversions(tokens, self.tables_info, tree),
+                            lambda: self.error_handler.validate_select_tables(tokens, self.tables_info, tree),
+                            lambda: self.error_handler.validate_select_columns(tokens, self.tables_info, tree)
                         ]
 
                         for validate_fn in validations:
@@ -314,49 +434,119 @@ class SyntaxAnalyzer:
                                 semantic_result = validation_result
                                 break
 
-                if semantic_result:
-                    semantic_result['steps'] = result['steps']
-                    semantic_result['statement_number'] = statement_count
-                    semantic_result['statement_tokens'] = current_statement_tokens
-                    results[-1] = semantic_result
+            if shape is not None:
+                self._cache_outcome((shape, self.catalog_version if self.tables_info else None), tokens, result, semantic_result)
 
-                    error_msgs = [f"Sentencia {statement_count}: {error}" for error in semantic_result['errors']]
-                    return {
-                        "status": "error",
-                        "message": "Se encontró un error semántico",
-                        "errors": error_msgs,
-                        "results": results
-                    }
+        return result, semantic_result
 
-            elif result['status'] == 'error':
-                error_msgs = [f"Sentencia {statement_count}: {error}" for error in result['errors']]
-                return {
-                    "status": "error",
-                    "message": "Se encontró un error sintáctico",
-                    "errors": error_msgs,
-                    "results": results
-                }
+    def _parse_insert(self, tokens, lexical_errors):
+        if lexical_errors[0] is not None or lexical_errors[1] is not None or len(tokens) < 8:
+            return None
+        if tokens[0].kind != 27 or tokens[1].kind != 28 or tokens[2].kind != 4 or tokens[3].kind != 29 or tokens[4].kind != 52:
+            return None
+
+        end = len(tokens) - 2
+        i = 5
+        while True:
+            if i >= end:
+                return None
+            kind = tokens[i].kind
+            if kind == 61 or kind == 62:
+                i += 1
+            elif kind == 54 and i + 2 < end and tokens[i + 1].kind == 62 and tokens[i + 2].kind == 54:
+                i += 3
+            else:
+                return None
+
+            if i == end:
+                break
+            if tokens[i].kind != 50:
+                return None
+            i += 1
+
+        if tokens[end].kind != 53 or tokens[end + 1].kind != 55:
+            return None
 
         return {
-            'status': 'success',
-            'message': 'Análisis de SQL completado exitosamente',
-            'errors': [],
-            'results': results
+            "status": "success",
+            "message": "Análisis sintáctico de INSERT completado con éxito",
+            "errors": [],
+            "steps": []
         }
 
-    def _parse_statement(self, tokens, statement_type):
-        self.reset()
-        self.tokens = tokens
+    def _cache_shape(self, context, tokens, statement_type, lexical_errors):
+        if context.trace != 'off' or statement_type == "CREATE" or tokens[0].start is None:
+            return None
+        if lexical_errors[0] is not None or lexical_errors[1] is not None:
+            return None
+
+        return (statement_type, context.recover, self.max_nesting_depth, self.max_statement_tokens, fingerprint(tokens))
+
+    def _cache_outcome(self, key, tokens, result, semantic_result):
+        positions = {(token.line, token.start): index for index, token in enumerate(tokens)}
+        outcome = []
+        for entry in (result, semantic_result):
+            if not entry:
+                outcome.append(None)
+                continue
+            errors = []
+            for error in entry['errors']:
+                index = positions.get((error.line, error.start))
+                if index is None:
+                    return
+                errors.append((index, error))
+            outcome.append(dict(entry, errors=errors))
+
+        self.parse_cache.put(key, tuple(outcome))
+
+    def _cached_outcome(self, outcome, tokens):
+        result, semantic_result = outcome
+        if semantic_result:
+            tokens.append(self._eof_token(tokens))
+            semantic_result = self._located(semantic_result, tokens)
+
+        result = self._located(result, tokens)
+        result['steps'] = []
+        return result, semantic_result
+
+    def _located(self, entry, tokens):
+        errors = []
+        for index, error in entry['errors']:
+            token = tokens[index] if index < len(tokens) else self._eof_token(tokens)
+            errors.append(error.relocated(token.line, token.span))
+        return dict(entry, errors=errors)
+
+    def _forbidden_result(self, diagnostics):
+        return {
+            "status": "error",
+            "message": "Se encontraron caracteres no permitidos",
+            "errors": [self.error_handler.format_error_message(101, diagnostics['forbidden_line'], span=diagnostics['forbidden_span'])],
+            "steps": []
+        }
+
+    def _parse_statement(self, context, tokens, statement_type, lexical_errors=None):
+        context.reset()
+        context.tokens = tokens
 
         if not tokens:
             return {"status": "error", "message": "No hay tokens para analizar", "errors": [], "steps": []}
 
-        error_msg = self.error_handler.check_malformed_strings(tokens)
+        if lexical_errors is None:
+            error_msg = self.error_handler.check_malformed_strings(tokens)
+        elif lexical_errors[0] is not None:
+            error_msg = self.error_handler.format_error_message(205, lexical_errors[0].line, span=lexical_errors[0].span)
+        else:
+            error_msg = None
         if error_msg:
             return {"status": "error", "message": "Se encontraron errores sintácticos",
                     "errors": [error_msg], "steps": []}
 
-        error_msg = self.error_handler.check_consecutive_constants(tokens, self.error_handler.get_token_type)
+        if lexical_errors is None:
+            error_msg = self.error_handler.check_consecutive_constants(tokens, self.error_handler.get_token_type)
+        elif lexical_errors[1] is not None:
+            error_msg = self.error_handler.format_error_message(205, lexical_errors[1].line, span=lexical_errors[1].span)
+        else:
+            error_msg = None
         if error_msg:
             return {"status": "error", "message": "Se encontraron errores sintácticos",
                     "errors": [error_msg], "steps": []}
@@ -367,296 +557,214 @@ class SyntaxAnalyzer:
                 return {"status": "error", "message": "Se encontraron errores sintácticos",
                         "errors": [error_msg], "steps": []}
 
-        self.stack = [199]
-
         if statement_type == "CREATE":
-            self.stack.append(201)
+            start_symbol = 201
         elif statement_type == "INSERT":
-            self.stack.append(211)
+            start_symbol = 211
         else:
-            self.stack.append(300)
-
-        self.current_token_index = 0
-        steps = []
+            start_symbol = 300
+
+        if self.recognizers is not None and context.trace == 'off' and self.error_handler.get_token_type(tokens[-1]) != 199:
+            kinds = [self.error_handler.get_token_type(token_info) for token_info in tokens]
+            kinds.append(199)
+            try:
+                accepted = ((self.max_nesting_depth is None or kinds.count(52) <= self.max_nesting_depth)
+                            and self.recognizers[start_symbol](kinds))
+            except RecursionError:
+                accepted = False
+            if accepted:
+                tokens.append(self._eof_token(tokens))
+                return self._format_result(context, statement_type, False, [])
+
+        context.stack = [199, start_symbol]
+
+        context.current_token_index = 0
+        tracing = context.trace != 'off'
+        steps = deque(maxlen=context.trace_steps) if context.trace == 'errors' else []
         error = False
-        subquery_level = 0
-        in_subquery_stack = []
-        parenthesis_stack = []
+        nesting = context.nesting
+        max_nesting_depth = self.max_nesting_depth
 
         has_artificial_eof = False
-        if self.current_token_index >= len(self.tokens) or self.error_handler.get_token_type(self.tokens[-1]) != 199:
-            eof_token = (tokens[-1][0] if tokens else 1, ("EOF", "$", 199, None))
-            self.tokens.append(eof_token)
+        if context.current_token_index >= len(context.tokens) or self.error_handler.get_token_type(context.tokens[-1]) != 199:
+            context.tokens.append(self._eof_token(tokens))
             has_artificial_eof = True
 
-        while self.stack and self.current_token_index < len(self.tokens) and not error:
-            X = self.stack.pop()
-
-            token_info = self.tokens[self.current_token_index]
-            line = token_info[0]
-            K = self.error_handler.get_token_type(token_info)
-
-            if X == 199 and K == 53 and len(parenthesis_stack) > 0:
-                self.stack.append(X)
-                X = 53
+        parse_table = self.parse_table
+        parse_rows = self.parse_rows
+        parse_width = self.parse_width
+        eof_nullable = self.eof_nullable
+        at_eof = False
 
-            if (K == 14 or K == 15) and self.current_context == 'WHERE_CONDITION' and subquery_level == 0:
-                if X != K and X != 317 and X != 312 and X != 311:
-                    self.stack.append(X)
-                    X = 311
+        recover = context.recover
+        last_error_index = -1
 
-            if K == 53 and self.current_context == 'IN_SUBQUERY' and X != 53:
-                self.stack.append(X)
-                self.stack.append(53)
-                X = 53
+        while context.stack and context.current_token_index < len(context.tokens) and (not error or recover):
+            X = context.stack.pop()
 
-            if statement_type == "SELECT" and X == 199 and K == 55:
-                if self.current_token_index == len(self.tokens) - (2 if has_artificial_eof else 1):
-                    self.current_token_index += 1
-                    self.stack.append(X)
-                    continue
+            token_info = context.tokens[context.current_token_index]
+            line = token_info.line
+            K = self.error_handler.get_token_type(token_info)
+            column = K if K < parse_width else parse_width
 
-            if self.current_token_index == len(self.tokens) - 1 and K == 199:
-                if not self.error_handler.is_terminal(X) and X != 199:
-                    if X in self.syntax_table and 199 in self.syntax_table[X]:
-                        production = self.syntax_table[X][199]
-                        for symbol in reversed(production):
-                            if symbol != 99:
-                                self.stack.append(symbol)
-                        continue
+            if K == 199 and not at_eof:
+                at_eof = True
+                if not tracing and X in eof_nullable and eof_nullable.issuperset(context.stack):
+                    context.stack.clear()
+                    break
 
-            self.update_context(X, K)
+            context.update_context(X, K)
 
-            step_info = {
-                "X": X,
-                "K": K,
-                "stack": self.stack.copy(),
-                "X_name": self.error_handler.get_symbol_name(X),
-                "K_name": self.error_handler.get_symbol_name(K),
-                "context": self.current_context
-            }
+            if tracing:
+                step_stack = context.stack.copy()
+                step_context = context.current_context
+            action = None
 
             if self.error_handler.is_terminal(X):
                 if X == K:
-                    step_info["action"] = f"Emparejado: {self.error_handler.get_symbol_name(X)}"
 
-                    if X == 13:
-                        in_subquery_stack.append(True)
-
-                    if X == 52:
-                        parenthesis_stack.append(52)
-                        if self.current_context == 'IN_SUBQUERY':
-                            subquery_level += 1
-
-                    if X == 53 and parenthesis_stack:
-                        parenthesis_stack.pop()
-                        if subquery_level > 0:
-                            subquery_level -= 1
-                            if subquery_level == 0 and in_subquery_stack:
-                                in_subquery_stack.pop()
-                                self.current_context = 'WHERE_CONDITION'
+                    if X == 52 and context.current_context == 'IN_SUBQUERY':
+                        if max_nesting_depth is not None and len(nesting) >= max_nesting_depth:
+                            error = True
+                            error_message = self.error_handler.format_error_message(
+                                210, line, f"La subconsulta excede la profundidad máxima de {max_nesting_depth} niveles.", token_info.span)
+                            context.errors.append(error_message)
+                            if tracing:
+                                steps.append((X, K, step_stack, step_context, error_message))
+                            break
+                        nesting.append(context.outer_context)
+                    elif X == 53 and nesting:
+                        context.current_context = nesting.pop()
 
                     if X != 199:
-                        self.current_token_index += 1
+                        context.current_token_index += 1
                 elif X == 99:
-                    step_info["action"] = "Epsilon: No acción"
                     continue
                 else:
-                    if X == 55 and K == 53 and (self.current_context == 'IN_SUBQUERY' or subquery_level > 0 or parenthesis_stack):
-                        self.stack.append(X)
-                        X = 53
-                        step_info["X"] = X
-                        step_info["X_name"] = self.error_handler.get_symbol_name(X)
-                        step_info["action"] = f"Emparejado: {self.error_handler.get_symbol_name(X)}"
-                        self.current_token_index += 1
-
-                        if parenthesis_stack:
-                            parenthesis_stack.pop()
-
-                        if subquery_level > 0:
-                            subquery_level -= 1
-
-                        if subquery_level == 0 and in_subquery_stack:
-                            in_subquery_stack.pop()
-                            self.current_context = 'WHERE_CONDITION'
-
-                        steps.append(step_info)
-                        continue
-                    elif X == 53 and K == 199 and len(parenthesis_stack) == 0:
-                        self.stack.append(199)
-                        continue
-                    else:
-                        error = True
-                        error_message = self.error_handler.classify_terminal_error(
-                            X, K, line, self.tokens, self.current_token_index,
-                            self.prev_token_type, self.current_context,
-                            self.last_id_token, self.prev_token
-                        )
+                    error = True
+                    error_message = self.error_handler.classify_terminal_error(
+                        X, K, line, context.tokens, context.current_token_index,
+                        context.prev_token_type, context.current_context,
+                        context.last_id_token, context.prev_token
+                    )
 
-                        step_info["action"] = f"ERROR: {error_message}"
-                        self.errors.append(error_message)
+                    action = error_message
+                    if context.current_token_index != last_error_index:
+                        context.errors.append(error_message)
+                    last_error_index = context.current_token_index
 
             else:
-                if X in self.syntax_table and K in self.syntax_table[X]:
-                    production = self.syntax_table[X][K]
-                    step_info["action"] = f"Producción: {self.error_handler.get_symbol_name(X)} -> {self.error_handler.array_to_string(production)}"
-
-                    for symbol in reversed(production):
-                        if symbol != 99:
-                            self.stack.append(symbol)
+                entry = parse_table[parse_rows[X] + column]
+                if entry is not None:
+                    action = entry
+                    context.stack.extend(entry[0])
                 else:
-                    epsilon_found = False
-
-                    for possible_K in [99, 199]:
-                        if X in self.syntax_table and possible_K in self.syntax_table[X]:
-                            production = self.syntax_table[X][possible_K]
-                            step_info["action"] = f"Producción (epsilon): {self.error_handler.get_symbol_name(X)} -> {self.error_handler.array_to_string(production)}"
-
-                            for symbol in reversed(production):
-                                if symbol != 99:
-                                    self.stack.append(symbol)
-
-                            epsilon_found = True
-                            break
-
-                    if not epsilon_found:
-                        error = True
-                        error_message = self.error_handler.classify_nonterminal_error(
-                            X, K, line, self.tokens, self.current_token_index,
-                            self.prev_token_type, self.current_context,
-                            self.last_id_token, self.prev_token
-                        )
-                        step_info["action"] = f"ERROR: {error_message}"
-                        self.errors.append(error_message)
+                    error = True
+                    error_message = self.error_handler.classify_nonterminal_error(
+                        X, K, line, context.tokens, context.current_token_index,
+                        context.prev_token_type, context.current_context,
+                        context.last_id_token, context.prev_token
+                    )
+                    action = error_message
+                    if context.current_token_index != last_error_index:
+                        context.errors.append(error_message)
+                    last_error_index = context.current_token_index
+                    if recover:
+                        self._synchronize(context, X)
 
-            steps.append(step_info)
+            if tracing:
+                steps.append((X, K, step_stack, step_context, action))
 
             if X == 199 and K == 199:
                 break
 
-        if self.stack and self.stack != [199] and not error:
-            if statement_type == "SELECT":
-                special_stack_patterns = [
-                    [199],
-                    [199, 201],
-                    [199, 312],
-                    [199, 201, 55],
-                    [199, 201, 55, 312]
-                ]
-
-                stack_without_redundant = self._simplify_stack(self.stack)
-                stack_valid = False
-
-                for pattern in special_stack_patterns:
-                    if self._match_stack_pattern(stack_without_redundant, pattern):
-                        stack_valid = True
-                        break
-
-                if stack_valid:
-                    self.stack = []
-
-            if len(self.stack) == 1 and self.stack[0] == 199:
-                self.stack = []
-            elif has_artificial_eof and self.current_token_index == len(self.tokens) - 1:
-                has_all_epsilon = True
-                for symbol in self.stack:
-                    if symbol != 199 and (symbol not in self.syntax_table or 199 not in self.syntax_table[symbol]):
-                        has_all_epsilon = False
-                        break
-
-                if has_all_epsilon:
-                    self.stack = []
-                else:
-                    error_code = 204
-
-                    incomplete_msg = f"Sentencia {statement_type} incompleta."
-
-                    if statement_type == "SELECT":
-                        if self.prev_token == self.error_handler.where_code or self.current_context == 'WHERE_CONDITION':
-                            error_code = 204
-                        elif self.prev_token == self.error_handler.select_code or self.current_context == 'SELECT_LIST':
-                            error_code = 204
-
-                    error_msg = self.error_handler.format_error_message(error_code, self.tokens[-1][0], incomplete_msg)
-                    self.errors.append(error_msg)
-                    error = True
-            else:
-                expected_symbol = None
-                for s in self.stack:
-                    if s != 199:
-                        expected_symbol = s
-                        break
-
-                if expected_symbol:
-                    error_code = self.error_handler.get_error_code_by_context(
-                        expected_symbol, current_context=self.current_context,
-                        prev_token_type=self.prev_token_type, prev_token=self.prev_token,
-                        last_id_token=self.last_id_token, tokens=self.tokens,
-                        current_token_index=self.current_token_index
-                    )
-                    error_msg = self.error_handler.format_error_message(error_code, self.tokens[-1][0])
-                else:
-                    error_msg = self.error_handler.format_error_message(201, self.tokens[-1][0])
-
-                self.errors.append(error_msg)
-                error = True
-
-        if self.current_token_index < len(self.tokens) - (1 if has_artificial_eof else 0) and not error:
-            token_linea = self.tokens[self.current_token_index][0]
+        if context.current_token_index < len(context.tokens) - (1 if has_artificial_eof else 0) and not error:
+            token_linea = context.tokens[context.current_token_index].line
+            token_span = context.tokens[context.current_token_index].span
 
             if statement_type == "SELECT":
-                token_type = self.error_handler.get_token_type(self.tokens[self.current_token_index])
-                if token_type in [61, 62] and self.prev_token_type == 4:
-                    error_msg = self.error_handler.format_error_message(208, token_linea)
-                    self.errors.append(error_msg)
+                token_type = self.error_handler.get_token_type(context.tokens[context.current_token_index])
+                if token_type in [61, 62] and context.prev_token_type == 4:
+                    error_msg = self.error_handler.format_error_message(208, token_linea, span=token_span)
+                    context.errors.append(error_msg)
                     error = True
-                    return self._format_result(statement_type, error, steps)
+                    return self._format_result(context, statement_type, error, steps)
 
-            error_msg = self.error_handler.format_error_message(201, token_linea)
-            self.errors.append(error_msg)
+            error_msg = self.error_handler.format_error_message(201, token_linea, span=token_span)
+            context.errors.append(error_msg)
             error = True
 
         elif statement_type == "SELECT" and not error and has_artificial_eof:
-            last_real_token_index = len(self.tokens) - 2
+            last_real_token_index = len(context.tokens) - 2
             if last_real_token_index >= 0:
-                last_token_type = self.error_handler.get_token_type(self.tokens[last_real_token_index])
+                last_token_type = self.error_handler.get_token_type(context.tokens[last_real_token_index])
                 if last_token_type != 55:
-                    token_linea = self.tokens[last_real_token_index][0]
-                    error_msg = self.error_handler.format_error_message(205, token_linea)
-                    self.errors.append(error_msg)
+                    token_linea = context.tokens[last_real_token_index].line
+                    error_msg = self.error_handler.format_error_message(205, token_linea, span=context.tokens[last_real_token_index].span)
+                    context.errors.append(error_msg)
                     error = True
 
-        return self._format_result(statement_type, error, steps)
-
-    def _simplify_stack(self, stack):
-        if not stack:
-            return stack
-
-        simplified = stack.copy()
+        return self._format_result(context, statement_type, error, steps)
+
+    def _synchronize(self, context, X):
+        tokens = context.tokens
+        row = self.parse_rows[X]
+        follow = self.follow_sets[X]
+
+        while context.current_token_index < len(tokens) - 1:
+            K = self.error_handler.get_token_type(tokens[context.current_token_index])
+            if self.parse_table[row + (K if K < self.parse_width else self.parse_width)] is not None:
+                context.stack.append(X)
+                return
+            if K == 55 and context.stack == [199] and context.current_token_index == len(tokens) - 2:
+                context.current_token_index += 1
+                return
+            if K == 55 or K in follow:
+                return
+            context.current_token_index += 1
+
+    def _eof_token(self, tokens):
+        eof_token = Token(tokens[-1].line if tokens else 1, "EOF", "$", 199)
+        if tokens and tokens[-1].start is not None:
+            eof_token.column = tokens[-1].column + len(tokens[-1].value)
+            eof_token.start = tokens[-1].end
+        return eof_token
+
+    def _format_steps(self, steps):
+        formatted = []
+        for X, K, stack, context, action in steps:
+            step_info = {
+                "X": X,
+                "K": K,
+                "stack": stack,
+                "X_name": self.error_handler.get_symbol_name(X),
+                "K_name": self.error_handler.get_symbol_name(K),
+                "context": context
+            }
 
-        i = 0
-        while i < len(simplified) - 3:
-            if (simplified[i:i+4] == [53, 201, 55, 312] or
-                simplified[i:i+3] == [53, 201, 55] or
-                simplified[i:i+2] == [53, 201]):
-                simplified = simplified[:i] + simplified[i+4:]
-                i = 0
+            if action is None:
+                step_info["action"] = f"Emparejado: {step_info['X_name']}"
+            elif isinstance(action, str):
+                step_info["action"] = f"ERROR: {action}"
             else:
-                i += 1
+                step_info["action"] = action[3]
 
-        return simplified
+            formatted.append(step_info)
 
-    def _match_stack_pattern(self, stack, pattern):
-        if len(stack) < len(pattern):
-            return False
+        return formatted
 
-        for i, symbol in enumerate(pattern):
-            if i >= len(stack) or stack[i] != symbol:
-                return False
+    def _semantic_steps(self, context, result):
+        if context.trace == 'errors':
+            return self._format_steps(context.trace_buffer)
+        return result['steps']
 
-        return True
+    def _format_result(self, context, statement_type, error, steps):
+        context.trace_buffer = steps
+        if context.trace == 'errors' and not error:
+            steps = []
+        else:
+            steps = self._format_steps(steps)
 
-    def _format_result(self, statement_type, error, steps):
         if not error:
             return {
                 "status": "success",
@@ -668,7 +776,7 @@ class SyntaxAnalyzer:
             return {
                 "status": "error",
                 "message": f"Se encontraron errores sintácticos en {statement_type}",
-                "errors": self.errors,
+                "errors": context.errors,
                 "steps": steps
             }
 
@@ -683,16 +791,18 @@ class SyntaxAnalyzer:
                     "errors": [self.db_connector.error if hasattr(self.db_connector, 'error') else "Error desconocido"]
                 }
 
-            for db_table in db_tables_info:
-                exists = False
-                for i, existing_table in enumerate(self.tables_info):
-                    if existing_table['name'].upper() == db_table['name'].upper():
-                        self.tables_info[i] = db_table
-                        exists = True
-                        break
+            with self.catalog_lock:
+                for db_table in db_tables_info:
+                    exists = False
+                    for i, existing_table in enumerate(self.tables_info):
+                        if existing_table['name'].upper() == db_table['name'].upper():
+                            self.tables_info[i] = db_table
+                            exists = True
+                            break
 
-                if not exists:
-                    self.tables_info.append(db_table)
+                    if not exists:
+                        self.tables_info.append(db_table)
+                self.catalog_version = next(catalog_versions)
 
             return {
                 "status": "success",
@@ -716,7 +826,7 @@ class SyntaxAnalyzer:
         for result in parse_result.get("results", []):
             statement_tokens = result.get("statement_tokens", [])
             if statement_tokens:
-                statement_type = statement_tokens[0][1][1].upper()
+                statement_type = statement_tokens[0].value.upper()
                 break
 
         execution_result = self.db_connector.execute_query(sql_query)
@@ -743,26 +853,20 @@ class SyntaxAnalyzer:
 
         return parse_result
 
-    def _find_attribute_line(self, tokens, attr_name):
-        for token_info in tokens:
-            line_num, (type_code, token, code, _) = token_info
-
-            if type_code == 4 and token.upper() == attr_name.upper():
-                return line_num
-
-        return 1
-
-    def _analyze_create_table(self, tokens):
-        tables = self.semantic_analyzer.analyze_ddl(tokens)
+    def _analyze_create_table(self, tokens, tree=None):
+        if tree is None:
+            tree = build_tree(tokens)
+        tables = self.semantic_analyzer.analyze_ddl(tokens, tree)
 
         for table in tables:
-            attr_names = []
+            attributes = {}
             for attr in table['attributes']:
-                if attr['name'] in attr_names:
-                    line_num = self._find_attribute_line(tokens, attr['name'])
+                if attr['name'] in attributes:
+                    attr_token = next(column.name for column in tree.columns if column.name.value == attr['name'])
                     error_msg = self.error_handler.format_error_message(
-                        317, line_num,
-                        f"El atributo '{attr['name']}' está duplicado en la tabla '{table['name']}'."
+                        317, attr_token.line,
+                        f"El atributo '{attr['name']}' está duplicado en la tabla '{table['name']}'.",
+                        attr_token.span
                     )
                     return {
                         "status": "error",
@@ -770,7 +874,7 @@ class SyntaxAnalyzer:
                         "errors": [error_msg],
                         "steps": []
                     }
-                attr_names.append(attr['name'])
+                attributes[attr['name']] = attr
 
             exists = False
             for existing_table in self.tables_info:
@@ -781,5 +885,36 @@ class SyntaxAnalyzer:
 
             if not exists:
                 self.tables_info.append(table)
+            self.catalog_version = next(catalog_versions)
 
         return None
+
+worker = None
+
+class BatchWorker:
+    def __init__(self, scanner_engine, catalog, cache_entries, cache_bytes, parser_backend, max_nesting_depth, max_statement_tokens):
+        self.catalog = catalog
+        self.analyzer = SyntaxAnalyzer(scanner_engine, cache_entries=cache_entries, cache_bytes=cache_bytes,
+                                       catalog=copy.deepcopy(catalog), parser_backend=parser_backend,
+                                       max_nesting_depth=max_nesting_depth, max_statement_tokens=max_statement_tokens)
+        self.catalog_version = self.analyzer.catalog_version
+
+    def parse(self, batch, trace, trace_steps, recover):
+        results = []
+        for index, script in batch:
+            if self.analyzer.catalog_version != self.catalog_version:
+                self.analyzer.tables_info = copy.deepcopy(self.catalog)
+                self.catalog_version = self.analyzer.catalog_version
+
+            if isinstance(script, os.PathLike):
+                with open(script, encoding='utf-8', newline='') as fileobj:
+                    script = fileobj.read()
+            results.append((index, self.analyzer.parse(script, trace, trace_steps, recover)))
+        return results
+
+def init_worker(scanner_engine, catalog, cache_entries, cache_bytes, parser_backend, max_nesting_depth, max_statement_tokens):
+    global worker
+    worker = BatchWorker(scanner_engine, catalog, cache_entries, cache_bytes, parser_backend, max_nesting_depth, max_statement_tokens)
+
+def parse_batch(batch, trace, trace_steps, recover):
+    return worker.parse(batch, trace, trace_steps, recover)
@@ -0,0 +1,293 @@
+import hashlib
+import importlib.util
+import marshal
+import os
+import threading
+
+table_format = 3
+
+grammar = {
+    200: [[16, 17, 4, 52, 202, 53, 55, 201]],
+    201: [[200], [211], [300], [99]],
+    202: [[4, 203, 216, 204, 217, 205]],
+    203: [[18], [19], [4]],
+    204: [[20, 21], [99]],
+    205: [[50, 206], [99]],
+    206: [[202], [207]],
+    207: [[22, 4, 208, 52, 218, 53, 209]],
+    208: [[24, 23], [25, 23]],
+    209: [[26, 4, 52, 4, 53, 210], [50, 207], [99]],
+    210: [[50, 207], [99]],
+    211: [[27, 28, 4, 29, 52, 212, 53, 55, 215]],
+    212: [[213, 214]],
+    213: [[54, 62, 54], [61], [62]],
+    214: [[50, 212], [99]],
+    215: [[211], [200], [300], [99]],
+    216: [[52, 61, 53], [99]],
+    217: [[24, 23], [99]],
+    218: [[4, 219]],
+    219: [[50, 4, 219], [99]],
+    300: [[10, 320, 301, 11, 306, 310, 55, 201]],
+    301: [[302], [72, 303]],
+    302: [[304, 303]],
+    303: [[50, 302], [99]],
+    304: [[4, 305]],
+    305: [[51, 4], [99]],
+    306: [[308, 307]],
+    307: [[50, 306], [99]],
+    308: [[4, 309]],
+    309: [[4], [99]],
+    310: [[12, 311], [99]],
+    311: [[313, 312], [318, 312], [14, 311], [15, 311]],
+    312: [[317, 311], [99]],
+    313: [[304, 314]],
+    314: [[13, 52, 321, 53], [315, 316]],
+    315: [[81], [82], [83], [84], [85], [86]],
+    316: [[304], [54, 318, 54], [318]],
+    317: [[14], [15]],
+    318: [[62], [319]],
+    319: [[61]],
+    320: [[30], [99]],
+    321: [[10, 320, 301, 11, 306, 310]]
+}
+
+start_symbols = (201, 211, 300)
+
+default_epsilon = frozenset({201, 215, 303, 305, 307, 309, 310, 312})
+
+symbols = tuple(sorted({symbol for productions in grammar.values() for production in productions for symbol in production} | set(grammar)))
+
+compiled_tables = {}
+compiled_lock = threading.Lock()
+
+def first_sets(grammar):
+    first = {X: set() for X in grammar}
+    nullable = set()
+
+    changed = True
+    while changed:
+        changed = False
+        for X, productions in grammar.items():
+            for production in productions:
+                symbols, empty = first_of(production, first, nullable)
+                if not symbols <= first[X]:
+                    first[X] |= symbols
+                    changed = True
+                if empty and X not in nullable:
+                    nullable.add(X)
+                    changed = True
+
+    return first, nullable
+
+def first_of(production, first, nullable):
+    symbols = set()
+    for symbol in production:
+        if symbol == 99:
+            continue
+        if symbol not in first:
+            symbols.add(symbol)
+            return symbols, False
+        symbols |= first[symbol]
+        if symbol not in nullable:
+            return symbols, False
+    return symbols, True
+
+def follow_sets(grammar, first, nullable):
+    follow = {X: set() for X in grammar}
+    for X in start_symbols:
+        follow[X].add(199)
+
+    changed = True
+    while changed:
+        changed = False
+        for X, productions in grammar.items():
+            for production in productions:
+                trailer = set(follow[X])
+                for symbol in reversed(production):
+                    if symbol == 99:
+                        continue
+                    if symbol not in grammar:
+                        trailer = {symbol}
+                        continue
+                    if not trailer <= follow[symbol]:
+                        follow[symbol] |= trailer
+                        changed = True
+                    if symbol in nullable:
+                        trailer = trailer | first[symbol]
+                    else:
+                        trailer = set(first[symbol])
+
+    return {X: frozenset(symbols) for X, symbols in follow.items()}
+
+def predict_table(grammar, symbol_name=str):
+    first, nullable = first_sets(grammar)
+    follow = follow_sets(grammar, first, nullable)
+
+    table = {}
+    conflicts = []
+    for X, productions in grammar.items():
+        row = table[X] = {}
+        for production in productions:
+            symbols, empty = first_of(production, first, nullable)
+            if empty:
+                symbols = symbols | follow[X]
+            for K in sorted(symbols):
+                if K in row and row[K] != production:
+                    conflicts.append(f"{symbol_name(X)} con {symbol_name(K)}: "
+                                     f"{' '.join(map(symbol_name, row[K]))} / {' '.join(map(symbol_name, production))}")
+                    continue
+                row[K] = production
+
+    if conflicts:
+        raise ValueError("La gramática no es LL(1): " + "; ".join(conflicts))
+    return table, follow
+
+def compile_table(grammar, error_handler):
+    syntax_table, follow = predict_table(grammar, error_handler.get_symbol_name)
+
+    width = max(K for row in syntax_table.values() for K in row) + 1
+    stride = width + 1
+    table = [None] * stride
+    rows = [0] * (max(syntax_table) + 1)
+
+    for X, row in syntax_table.items():
+        X_name = error_handler.get_symbol_name(X)
+        default = None
+        if X in default_epsilon:
+            production = next(production for production in grammar[X] if production == [99])
+            default = (tuple(symbol for symbol in reversed(production) if symbol != 99), production, True,
+                       f"Producción (epsilon): {X_name} -> {error_handler.array_to_string(production)}")
+
+        cells = [default] * stride
+        for K, production in row.items():
+            cells[K] = (tuple(symbol for symbol in reversed(production) if symbol != 99), production, False,
+                        f"Producción: {X_name} -> {error_handler.array_to_string(production)}")
+
+        rows[X] = len(table)
+        table.extend(cells)
+
+    eof_column = min(199, width)
+    eof_nullable = frozenset([199] + [X for X in syntax_table if table[rows[X] + eof_column] is not None and not table[rows[X] + eof_column][0]])
+
+    return {
+        "syntax_table": syntax_table,
+        "parse_table": table,
+        "parse_rows": rows,
+        "parse_width": width,
+        "follow_sets": follow,
+        "eof_nullable": eof_nullable,
+        "parser_code": compile(parser_source(syntax_table), "<grammar>", "exec")
+    }
+
+def parser_source(syntax_table):
+    lines = []
+    for X in sorted(syntax_table):
+        choices = {}
+        for K, production in sorted(syntax_table[X].items()):
+            choices.setdefault(tuple(production), []).append(K)
+
+        loops = any(production[-1] == X for production in choices)
+        indent = "        " if loops else "    "
+        lines.append(f"def parse_{X}(kinds, i):")
+        if loops:
+            lines.append("    while True:")
+        lines.append(f"{indent}k = kinds[i]")
+
+        bodies = {}
+        for production, lookaheads in choices.items():
+            if X in default_epsilon and production == (99,):
+                continue
+            bodies.setdefault(tuple(production_source(X, production)), []).extend(lookaheads)
+
+        for body, lookaheads in bodies.items():
+            lookaheads.sort()
+            test = f"k == {lookaheads[0]}" if len(lookaheads) == 1 else f"k in {{{', '.join(map(str, lookaheads))}}}"
+            lines.append(f"{indent}if {test}:")
+            lines.extend(f"{indent}    {line}" for line in body)
+
+        lines.append(f"{indent}return {'i' if X in default_epsilon else -1}")
+        lines.append("")
+
+    for X in start_symbols:
+        lines.append(f"def recognize_{X}(kinds):")
+        lines.append(f"    i = parse_{X}(kinds, 0)")
+        lines.append("    return i >= 0 and kinds[i] == 199")
+        lines.append("")
+
+    return "\n".join(lines)
+
+def production_source(X, production):
+    symbols = [symbol for symbol in production if symbol != 99]
+    lines = []
+    first = True
+    while symbols:
+        terminals = []
+        while symbols and symbols[0] not in grammar:
+            terminals.append(symbols.pop(0))
+        if terminals:
+            checks = [f"kinds[i{f' + {offset}' if offset else ''}] != {K}" for offset, K in enumerate(terminals) if not (first and offset == 0)]
+            if checks:
+                lines.append(f"if {' or '.join(checks)}:")
+                lines.append("    return -1")
+        first = False
+        if not symbols:
+            lines.append(f"return i + {len(terminals)}" if terminals else "return i")
+            return lines
+        if terminals:
+            lines.append(f"i += {len(terminals)}")
+
+        Y = symbols.pop(0)
+        if symbols:
+            lines.append(f"i = parse_{Y}(kinds, i)")
+            lines.append("if i < 0:")
+            lines.append("    return i")
+        elif Y == X:
+            lines.append("continue")
+        else:
+            lines.append(f"return parse_{Y}(kinds, i)")
+            return lines
+
+    return lines or ["return i"]
+
+def table_key(grammar, names):
+    source = (table_format, importlib.util.MAGIC_NUMBER, sorted((X, productions) for X, productions in grammar.items()), sorted(start_symbols),
+              sorted(default_epsilon), names)
+    return hashlib.sha1(repr(source).encode()).hexdigest()[:16]
+
+def load_table(error_handler, cache_dir=None):
+    names = tuple(error_handler.get_symbol_name(symbol) for symbol in symbols)
+    compiled = compiled_tables.get(names)
+    if compiled is not None:
+        return compiled
+
+    with compiled_lock:
+        compiled = compiled_tables.get(names)
+        if compiled is not None:
+            return compiled
+
+        key = table_key(grammar, names)
+
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__pycache__')
+        path = os.path.join(cache_dir, f"grammar.{key}.table")
+
+        try:
+            with open(path, 'rb') as fileobj:
+                compiled = marshal.loads(fileobj.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            compiled = compile_table(grammar, error_handler)
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                partial = f"{path}.{os.getpid()}.{threading.get_ident()}"
+                with open(partial, 'wb') as fileobj:
+                    fileobj.write(marshal.dumps(compiled))
+                os.replace(partial, path)
+            except OSError:
+                pass
+
+        namespace = {}
+        exec(compiled['parser_code'], namespace)
+        compiled['recognizers'] = {X: namespace[f"recognize_{X}"] for X in start_symbols}
+
+        compiled_tables[names] = compiled
+        return compiled
@@ -1,4 +1,10 @@
+import os
 import re
+import mmap
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, chain
+from concurrent.futures import ProcessPoolExecutor
 
 reserved_words = {
     'SELECT': ('s', 10),
@@ -54,26 +60,388 @@ relational_operators = {
     '<>': 86
 }
 
+forbidden_characters = {'&', '@', '$', '!', '^', '%', '?', '~', '|', '\\', '`', '"'}
+
+reserved_names = {word: word for word in reserved_words}
+
+def constant_kind(value):
+    if value.startswith("'") and value.endswith("'"):
+        return 62
+    try:
+        float(value)
+        return 61
+    except ValueError:
+        return 62
+
+def malformed_string(value):
+    if value == "''":
+        return False
+    
+    if value == "'":
+        return True
+    
+    if value.startswith("'") != value.endswith("'"):
+        return True
+    
+    if value.startswith("'") and value.endswith("'") and len(value) > 2:
+        content = value[1:-1]
+        i = 0
+        while i < len(content):
+            if i < len(content) - 1 and content[i:i+2] == "''":
+                i += 2
+            else:
+                if content[i] == "'":
+                    return True
+                i += 1
+    
+    if value.count("'") > 2 and value.startswith("'") and value.endswith("'"):
+        if value[1:-1].count("'") % 2 != 0:
+            return True
+    
+    return False
+
+def token_kind(code, value):
+    if code >= 400 and code < 500:
+        return 4
+    if code >= 600 and code < 750:
+        return constant_kind(value)
+    return code
+
+def literal_placeholder(token):
+    if token.kind == 61:
+        return '?'
+    if token.kind == 62 and len(token.value) > 1 and token.value.startswith("'") and token.value.endswith("'"):
+        return "'?'"
+    return token.value
+
+def fingerprint(tokens):
+    return tuple((token.kind, literal_placeholder(token)) for token in tokens)
+
+class Token:
+    __slots__ = ('line', 'type', 'value', 'code', 'extra', 'kind', 'column', 'start')
+    
+    def __init__(self, line, type_code, value, code, extra=None, kind=None, column=None, start=None):
+        self.line = line
+        self.type = type_code
+        self.value = value
+        self.code = code
+        self.extra = extra
+        self.kind = token_kind(code, value) if kind is None else kind
+        self.column = column
+        self.start = start
+    
+    @property
+    def info(self):
+        return (self.type, self.value, self.code, self.extra)
+    
+    @property
+    def end(self):
+        if self.start is None:
+            return None
+        return self.start + len(self.value)
+    
+    @property
+    def span(self):
+        return (self.column, self.start, self.end)
+    
+    def __getitem__(self, index):
+        if index == 1 or index == -1:
+            return (self.type, self.value, self.code, self.extra)
+        if index == 0 or index == -2:
+            return self.line
+        return (self.line, (self.type, self.value, self.code, self.extra))[index]
+    
+    def __len__(self):
+        return 2
+    
+    def __iter__(self):
+        yield self.line
+        yield (self.type, self.value, self.code, self.extra)
+    
+    def __eq__(self, other):
+        if isinstance(other, Token):
+            return (self.line == other.line and self.type == other.type and self.value == other.value
+                    and self.code == other.code and self.extra == other.extra)
+        if isinstance(other, tuple):
+            return tuple(self) == other
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"Token({self.line!r}, {self.type!r}, {self.value!r}, {self.code!r}, {self.extra!r})"
+
+class Symbol:
+    __slots__ = ('code', 'lines', 'positions')
+    
+    def __init__(self, code, line, column):
+        self.code = code
+        self.lines = [line]
+        self.positions = array('i', (line, column))
+
+def position_index(positions, line, column):
+    low = 0
+    high = len(positions) // 2
+    while low < high:
+        middle = (low + high) // 2
+        if (positions[2 * middle], positions[2 * middle + 1]) < (line, column):
+            low = middle + 1
+        else:
+            high = middle
+    return 2 * low
+
+class SymbolTable:
+    def __init__(self, first_code):
+        self.first_code = first_code
+        self.next_code = first_code
+        self.symbols = {}
+        self.reordered = False
+    
+    def add(self, name, line, column=0):
+        symbol = self.symbols.get(name)
+        if symbol is None:
+            symbol = Symbol(self.next_code, line, column)
+            self.symbols[name] = symbol
+            self.next_code += 1
+        else:
+            if symbol.lines[-1] != line:
+                symbol.lines.append(line)
+            symbol.positions.append(line)
+            symbol.positions.append(column)
+        return symbol
+    
+    def insert(self, name, line, column=0):
+        symbol = self.symbols.get(name)
+        if symbol is None:
+            if self.symbols:
+                last = self.symbols[next(reversed(self.symbols))].positions
+                if (last[0], last[1]) > (line, column):
+                    self.reordered = True
+            symbol = Symbol(self.next_code, line, column)
+            self.symbols[name] = symbol
+            self.next_code += 1
+            return symbol
+        
+        positions = symbol.positions
+        if (positions[-2], positions[-1]) < (line, column):
+            positions.append(line)
+            positions.append(column)
+            if symbol.lines[-1] != line:
+                symbol.lines.append(line)
+            return symbol
+        
+        index = position_index(positions, line, column)
+        positions[index:index] = array('i', (line, column))
+        if index == 0:
+            self.reordered = True
+        
+        lines = symbol.lines
+        at = bisect_left(lines, line)
+        if at == len(lines) or lines[at] != line:
+            lines.insert(at, line)
+        return symbol
+    
+    def discard(self, name, line, column=0):
+        symbol = self.symbols[name]
+        positions = symbol.positions
+        index = position_index(positions, line, column)
+        del positions[index:index + 2]
+        
+        if not positions:
+            del self.symbols[name]
+            self.reordered = True
+            return
+        if index == 0:
+            self.reordered = True
+        
+        if index < len(positions) and positions[index] == line:
+            return
+        if index > 0 and positions[index - 2] == line:
+            return
+        symbol.lines.pop(bisect_left(symbol.lines, line))
+    
+    def shift(self, first_line, delta):
+        for symbol in self.symbols.values():
+            lines = symbol.lines
+            if lines[-1] < first_line:
+                continue
+            for at in range(bisect_left(lines, first_line), len(lines)):
+                lines[at] += delta
+            positions = symbol.positions
+            for index in range(position_index(positions, first_line, -1), len(positions), 2):
+                positions[index] += delta
+    
+    def renumber(self):
+        self.reordered = False
+        ordered = sorted(self.symbols.items(), key=lambda item: (item[1].positions[0], item[1].positions[1]))
+        changed = False
+        
+        self.symbols = {}
+        for code, (name, symbol) in enumerate(ordered, self.first_code):
+            if symbol.code != code:
+                symbol.code = code
+                changed = True
+            self.symbols[name] = symbol
+        self.next_code = self.first_code + len(ordered)
+        return changed
+    
+    def occurrences(self, name):
+        positions = self.symbols[name].positions
+        return list(zip(positions[::2], positions[1::2]))
+    
+    def __getitem__(self, name):
+        symbol = self.symbols[name]
+        return (symbol.code, symbol.lines)
+    
+    def get(self, name, default=None):
+        symbol = self.symbols.get(name)
+        if symbol is None:
+            return default
+        return (symbol.code, symbol.lines)
+    
+    def __contains__(self, name):
+        return name in self.symbols
+    
+    def __iter__(self):
+        return iter(self.symbols)
+    
+    def __len__(self):
+        return len(self.symbols)
+    
+    def keys(self):
+        return self.symbols.keys()
+    
+    def values(self):
+        return [(symbol.code, symbol.lines) for symbol in self.symbols.values()]
+    
+    def items(self):
+        return [(name, (symbol.code, symbol.lines)) for name, symbol in self.symbols.items()]
+
+def stripped_lines(fileobj):
+    pending = None
+    pending_number = 0
+    pending_start = 0
+    blank_starts = []
+    start = 0
+    
+    for number, raw_line in enumerate(fileobj, 1):
+        line = raw_line.rstrip('\n')
+        line_start = start
+        start += len(raw_line)
+        
+        if not line.strip():
+            if pending is not None:
+                blank_starts.append(line_start)
+            continue
+        
+        if pending is not None:
+            yield pending_number, pending_start, pending
+            for blank, blank_start in enumerate(blank_starts, 1):
+                yield pending_number + blank, blank_start, ''
+        
+        pending = line
+        pending_number = number
+        pending_start = line_start
+        blank_starts = []
+    
+    if pending is not None:
+        yield pending_number, pending_start, pending.rstrip()
+
+byte_token_pattern = re.compile(rb"""
+    '[^']*'?
+  | <[>=]? | >=? | =>?
+  | [\w\#][\w\#.]*
+  | \S
+""", re.VERBOSE)
+
+unsafe_bytes = re.compile(rb'[^\t\x0b\x0c\r\x20-\x7e]')
+nonblank_bytes = re.compile(rb'[^ \t\x0b\x0c\r]')
+trailing_blanks = b' \t\x0b\x0c\r'
+release_step = 1 << 26
+
+def mapped_lines(buffer):
+    pending = None
+    blank_lines = []
+    size = len(buffer)
+    number = 0
+    pos = 0
+    chars = 0
+    
+    while pos < size:
+        end = buffer.find(b'\n', pos)
+        if end == -1:
+            end = size
+        number += 1
+        
+        if unsafe_bytes.search(buffer, pos, end) is None:
+            text = None
+            blank = nonblank_bytes.search(buffer, pos, end) is None
+            length = end - pos
+        else:
+            text = buffer[pos:end].decode('utf-8')
+            blank = not text.strip()
+            length = len(text)
+        
+        if blank:
+            if pending is not None:
+                blank_lines.append((number, chars, pos, pos, None))
+        else:
+            if pending is not None:
+                yield pending
+                yield from blank_lines
+            pending = (number, chars, pos, end, text)
+            blank_lines = []
+        
+        chars += length + 1
+        pos = end + 1
+    
+    if pending is not None:
+        number, chars, pos, end, text = pending
+        if text is None:
+            while end > pos and buffer[end - 1] in trailing_blanks:
+                end -= 1
+        else:
+            text = text.rstrip()
+        yield number, chars, pos, end, text
+
 class DMLScanner:
     def __init__(self):
         self.tokens = []
         self.line_number = 1
         self.current_tokens = []
-        self.identifier_counter = 401
-        self.constant_counter = 600
-        self.identifiers = {}
-        self.constants = {}
+        self.identifiers = SymbolTable(401)
+        self.constants = SymbolTable(600)
         self.last_operator = None
+        self.line_offset = 0
+        self.line_start = 0
+        self.column_offset = 0
+        self.last_token = None
+        self.byte_words = {}
+        self.diagnostics = {
+            'forbidden_line': None,
+            'forbidden_span': None,
+            'malformed_strings': [],
+            'consecutive_constants': []
+        }
     
     def reset(self):
         self.tokens = []
         self.line_number = 1
         self.current_tokens = []
-        self.identifier_counter = 401
-        self.constant_counter = 600
-        self.identifiers = {}
-        self.constants = {}
+        self.identifiers = SymbolTable(401)
+        self.constants = SymbolTable(600)
         self.last_operator = None
+        self.line_offset = 0
+        self.line_start = 0
+        self.column_offset = 0
+        self.last_token = None
+        self.byte_words = {}
+        self.diagnostics = {
+            'forbidden_line': None,
+            'forbidden_span': None,
+            'malformed_strings': [],
+            'consecutive_constants': []
+        }
     
     def analyze_sql(self, sql_query):
         self.reset()
@@ -84,6 +452,7 @@ class DMLScanner:
             'tokens': self.tokens,
             'identifiers': self.identifiers,
             'constants': self.constants,
+            'diagnostics': self.diagnostics,
         }
     
     def get_token_type_text(self, type_code):
@@ -99,64 +468,189 @@ class DMLScanner:
     
     def input_module(self, sql_query):
         lines = sql_query.strip().split('\n')
+        leading = len(sql_query) - len(sql_query.lstrip())
         self.line_number = 1
+        self.line_offset = sql_query[:leading].count('\n')
+        self.line_start = sql_query.rfind('\n', 0, leading) + 1
+        self.column_offset = leading - self.line_start
         
         for line in lines:
-            line = line.replace("'", "'")
-            line = line.replace("'", "'")
+            self.scan_line(line)
+            self.line_number += 1
+            self.line_start += self.column_offset + len(line) + 1
+            self.column_offset = 0
+    
+    def analyze_file(self, path):
+        self.reset()
+        
+        for _ in self.scan_mapped(path):
+            pass
+        
+        return {
+            'tokens': self.tokens,
+            'identifiers': self.identifiers,
+            'constants': self.constants,
+            'diagnostics': self.diagnostics,
+        }
+    
+    def iter_tokens(self, fileobj):
+        self.reset()
+        return self._stream_tokens(self.scan_lines(stripped_lines(fileobj)))
+    
+    def iter_file_tokens(self, path):
+        self.reset()
+        return self._stream_tokens(self.scan_mapped(path))
+    
+    def scan_lines(self, lines):
+        for number, line_start, line in lines:
+            self.line_offset = number - self.line_number
+            self.line_start = line_start
+            self.scan_line(line)
+            self.line_number += 1
+            yield
+    
+    def scan_mapped(self, path):
+        with open(path, 'rb') as fileobj:
+            if os.fstat(fileobj.fileno()).st_size == 0:
+                return
             
-            tokens = []
-            i = 0
-            while i < len(line):
-                if line[i] == "'":
-                    start = i
-                    i += 1
-                    while i < len(line) and line[i] != "'":
-                        i += 1
-                    if i < len(line):
-                        i += 1
-                        tokens.append(line[start:i])
-                    else:
-                        tokens.append(line[start:])
-                
-                elif line[i] in ',;()':
-                    tokens.append(line[i])
-                    i += 1
-                
-                elif line[i] == '.':
-                    tokens.append(line[i])
-                    i += 1
+            with mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                release = hasattr(buffer, 'madvise') and hasattr(mmap, 'MADV_DONTNEED')
+                if release and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    buffer.madvise(mmap.MADV_SEQUENTIAL)
+                released = 0
                 
-                elif line[i] in '<>=':
-                    start = i
-                    i += 1
-                    if i < len(line) and ((line[i-1] == '<' and line[i] in '>=') or 
-                                         (line[i-1] == '>' and line[i] == '=') or
-                                         (line[i-1] == '=' and line[i] == '>')):
-                        i += 1
-                    tokens.append(line[start:i])
-                    self.last_operator = line[start:i]
-                
-                elif line[i] in '+-*/':
-                    tokens.append(line[i])
+                for number, line_start, pos, end, text in mapped_lines(buffer):
+                    self.line_offset = number - self.line_number
+                    self.line_start = line_start
+                    if text is None:
+                        self.scan_words(self.mapped_words(buffer, pos, end))
+                    else:
+                        self.scan_line(text)
+                    self.line_number += 1
+                    
+                    if release and pos - released >= release_step:
+                        stop = pos - pos % mmap.PAGESIZE
+                        buffer.madvise(mmap.MADV_DONTNEED, released, stop - released)
+                        released = stop
+                    
+                    yield
+    
+    def mapped_words(self, buffer, pos, end):
+        byte_words = self.byte_words
+        words = []
+        for match in byte_token_pattern.finditer(buffer, pos, end):
+            word = match.group()
+            text = byte_words.get(word)
+            if text is None:
+                text = word.decode('ascii')
+                if word[:1] != b"'":
+                    byte_words[word] = text
+            words.append((text, match.start() - pos))
+        return words
+    
+    def scan_words(self, words):
+        for word, _ in reversed(words):
+            if word[0] in '<>=':
+                self.last_operator = word
+                break
+        
+        for word, column in words:
+            if word in forbidden_characters:
+                self.forbidden_character(column)
+                break
+        
+        self.analyze_tokens([word for word, _ in words], [column for _, column in words])
+    
+    def _stream_tokens(self, scanned):
+        for _ in scanned:
+            tokens = self.tokens
+            self.tokens = []
+            del self.current_tokens[:-1]
+            
+            if self.diagnostics['forbidden_line'] is not None:
+                return
+            
+            if tokens:
+                self.last_token = tokens[-1]
+            yield from tokens
+    
+    def forbidden_character(self, column):
+        if self.diagnostics['forbidden_line'] is None:
+            column += self.column_offset
+            self.diagnostics['forbidden_line'] = self.line_number + self.line_offset
+            self.diagnostics['forbidden_span'] = (column, self.line_start + column, self.line_start + column + 1)
+    
+    def check_constant(self, token):
+        previous = self.tokens[-1] if self.tokens else self.last_token
+        if previous is not None and (previous.kind == 61 or previous.kind == 62):
+            self.diagnostics['consecutive_constants'].append(token)
+    
+    def scan_line(self, line):
+        line = line.replace("'", "'")
+        line = line.replace("'", "'")
+        
+        tokens = []
+        columns = []
+        i = 0
+        while i < len(line):
+            if line[i] == "'":
+                start = i
+                i += 1
+                while i < len(line) and line[i] != "'":
                     i += 1
-                
-                elif line[i].isalnum() or line[i] == '#' or line[i] == '_':
-                    start = i
+                if i < len(line):
                     i += 1
-                    while i < len(line) and (line[i].isalnum() or line[i] == '#' or line[i] == '_' or line[i] == '.'):
-                        i += 1
                     tokens.append(line[start:i])
-                
-                elif line[i].isspace():
-                    i += 1
-                
                 else:
-                    tokens.append(line[i])
+                    tokens.append(line[start:])
+                columns.append(start)
+            
+            elif line[i] in ',;()':
+                tokens.append(line[i])
+                columns.append(i)
+                i += 1
+            
+            elif line[i] == '.':
+                tokens.append(line[i])
+                columns.append(i)
+                i += 1
+            
+            elif line[i] in '<>=':
+                start = i
+                i += 1
+                if i < len(line) and ((line[i-1] == '<' and line[i] in '>=') or 
+                                     (line[i-1] == '>' and line[i] == '=') or
+                                     (line[i-1] == '=' and line[i] == '>')):
                     i += 1
+                tokens.append(line[start:i])
+                columns.append(start)
+                self.last_operator = line[start:i]
             
-            self.analyze_tokens(tokens)
-            self.line_number += 1
+            elif line[i] in '+-*/':
+                tokens.append(line[i])
+                columns.append(i)
+                i += 1
+            
+            elif line[i].isalnum() or line[i] == '#' or line[i] == '_':
+                start = i
+                i += 1
+                while i < len(line) and (line[i].isalnum() or line[i] == '#' or line[i] == '_' or line[i] == '.'):
+                    i += 1
+                tokens.append(line[start:i])
+                columns.append(start)
+            
+            elif line[i].isspace():
+                i += 1
+            
+            else:
+                if line[i] in forbidden_characters:
+                    self.forbidden_character(i)
+                tokens.append(line[i])
+                columns.append(i)
+                i += 1
+        
+        self.analyze_tokens(tokens, columns)
     
     def is_constant(self, token, prev_tokens=None):
         if token.startswith("'") and token.endswith("'"):
@@ -181,7 +675,7 @@ class DMLScanner:
                 return True
             
         return False
-
+    
     def is_identifier(self, token):
         if token.upper() in reserved_words:
             return False
@@ -199,13 +693,13 @@ class DMLScanner:
             
         return token.isalnum() or '#' in token or '_' in token
             
-    def analyze_module(self, token):
+    def analyze_module(self, token, column=0):
         token_upper = token.upper()
         
         if token_upper in reserved_words:
             symbol, id_ = reserved_words[token_upper]
             self.current_tokens.append(token)
-            return (1, token_upper, id_, symbol)
+            return (1, reserved_names[token_upper], id_, symbol)
         
         if token in delimiters:
             self.current_tokens.append(token)
@@ -225,38 +719,565 @@ class DMLScanner:
             if token.startswith("'") and token.endswith("'"):
                 clean_token = token[1:-1]
                 
-            if clean_token not in self.constants:
-                self.constants[clean_token] = (self.constant_counter, [self.line_number])
-                self.constant_counter += 1
-            else:
-                if self.line_number not in self.constants[clean_token][1]:
-                    self.constants[clean_token] = (self.constants[clean_token][0], self.constants[clean_token][1] + [self.line_number])
+            symbol = self.constants.add(clean_token, self.line_number, column)
             
             self.current_tokens.append(token)
             self.last_operator = None
-            return (6, token, self.constants[clean_token][0], self.constants[clean_token][1])
+            return (6, token, symbol.code, symbol.lines)
         
         if self.is_identifier(token):
-            if token not in self.identifiers:
-                self.identifiers[token] = (self.identifier_counter, [self.line_number])
-                self.identifier_counter += 1
-            else:
-                if self.line_number not in self.identifiers[token][1]:
-                    self.identifiers[token] = (self.identifiers[token][0], self.identifiers[token][1] + [self.line_number])
+            symbol = self.identifiers.add(token, self.line_number, column)
             
             self.current_tokens.append(token)
-            return (4, token, self.identifiers[token][0], self.identifiers[token][1])
+            return (4, token, symbol.code, symbol.lines)
         
         return None
     
-    def analyze_tokens(self, words):
-        for word in words:
-            token_info = self.analyze_module(word)
+    def analyze_tokens(self, words, columns):
+        column_offset = self.column_offset
+        line_start = self.line_start + column_offset
+        for word, column in zip(words, columns):
+            token_info = self.analyze_module(word, column)
             if token_info:
-                self.tokens.append((self.line_number, token_info))
+                self.append_token(Token(self.line_number, *token_info, None, column + column_offset, line_start + column))
                 
                 if token_info[0] == 8:
                     self.last_operator = word
+    
+    def append_token(self, token):
+        if token.kind == 61 or token.kind == 62:
+            self.check_constant(token)
+        if token.value[:1] == "'" and malformed_string(token.value):
+            self.diagnostics['malformed_strings'].append(token)
+        self.tokens.append(token)
+
+token_pattern = re.compile(r"""
+    '[^']*'?
+  | <[>=]? | >=? | =>?
+  | [\w\#][\w\#.]*
+  | \S
+""", re.VERBOSE)
+
+ascii_letters = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')
+
+class RegexDMLScanner(DMLScanner):
+    def __init__(self):
+        super().__init__()
+        self.word_kinds = {}
+    
+    def reset(self):
+        super().reset()
+        self.word_kinds = {}
+    
+    def scan_line(self, line):
+        words = [(match.group(), match.start()) for match in token_pattern.finditer(line)]
+        
+        if '<' in line or '>' in line or '=' in line:
+            for word, _ in reversed(words):
+                if word[0] in '<>=':
+                    self.last_operator = word
+                    break
+        
+        self.classify_tokens(words)
+    
+    def scan_words(self, words):
+        for word, _ in reversed(words):
+            if word[0] in '<>=':
+                self.last_operator = word
+                break
+        
+        self.classify_tokens(words)
+    
+    def classify_word(self, word):
+        word_upper = word.upper()
+        if word_upper in reserved_words:
+            symbol, id_ = reserved_words[word_upper]
+            return (1, reserved_names[word_upper], id_, symbol)
+        
+        if word in delimiters:
+            return (5, delimiters[word])
+        
+        if word in relational_operators:
+            return (8, relational_operators[word])
+        
+        if word in operators:
+            return (7, operators[word])
+        
+        first = word[0]
+        if not (first.isalnum() or first == '#' or first == '_'):
+            return (None,)
+        
+        if word.isdigit():
+            return (6,)
+        
+        if '.' in word:
+            parts = word.split('.')
+            if len(parts) == 2 and all(part.isalnum() or '#' in part or '_' in part for part in parts):
+                return (4,)
+            if '#' in word or '_' in word:
+                return (4,)
+            return (0,)
+        
+        if '#' in word or (first in ascii_letters and word.isalnum()):
+            return (4,)
+        
+        return (9,)
+    
+    def classify_tokens(self, words):
+        line_number = self.line_number
+        tokens = self.tokens
+        current_tokens = self.current_tokens
+        identifiers = self.identifiers
+        constants = self.constants
+        word_kinds = self.word_kinds
+        column_offset = self.column_offset
+        line_start = self.line_start + column_offset
+        previous = current_tokens[-1] if current_tokens else None
+        
+        for word, column in words:
+            if word[0] == "'" and len(word) > 1 and word[-1] == "'":
+                symbol = constants.add(word[1:-1], line_number, column)
+                code = symbol.code
+                token = Token(line_number, 6, word, code, symbol.lines, 62 if code >= 600 and code < 750 else None,
+                              column + column_offset, line_start + column)
+                if token.kind == 62:
+                    self.check_constant(token)
+                tokens.append(token)
+                previous = word
+                self.last_operator = None
+                continue
+            
+            kind = word_kinds.get(word)
+            if kind is None:
+                kind = self.classify_word(word)
+                if word[0] != "'":
+                    word_kinds[word] = kind
+            type_code = kind[0]
+            
+            if type_code == 9:
+                if self.last_operator in relational_operators or previous == '=':
+                    type_code = 6
+                else:
+                    type_code = 4
+            
+            if type_code == 4:
+                symbol = identifiers.add(word, line_number, column)
+                code = symbol.code
+                if code < 500:
+                    tokens.append(Token(line_number, 4, word, code, symbol.lines, 4, column + column_offset, line_start + column))
+                else:
+                    self.append_token(Token(line_number, 4, word, code, symbol.lines, None, column + column_offset, line_start + column))
+            elif type_code == 1:
+                tokens.append(Token(line_number, 1, kind[1], kind[2], kind[3], kind[2], column + column_offset, line_start + column))
+            elif type_code == 5:
+                if word == "'":
+                    self.append_token(Token(line_number, 5, word, kind[1], None, kind[1], column + column_offset, line_start + column))
+                else:
+                    tokens.append(Token(line_number, 5, word, kind[1], None, kind[1], column + column_offset, line_start + column))
+            elif type_code == 6:
+                symbol = constants.add(word, line_number, column)
+                self.append_token(Token(line_number, 6, word, symbol.code, symbol.lines, None, column + column_offset, line_start + column))
+                self.last_operator = None
+            elif type_code == 8:
+                self.last_operator = word
+                tokens.append(Token(line_number, 8, word, kind[1], None, kind[1], column + column_offset, line_start + column))
+            elif type_code == 7:
+                tokens.append(Token(line_number, 7, word, kind[1], None, kind[1], column + column_offset, line_start + column))
+            elif type_code is None:
+                if previous is not None:
+                    current_tokens.append(previous)
+                if word in forbidden_characters:
+                    self.forbidden_character(column)
+                token_info = self.analyze_module(word, column)
+                if token_info:
+                    self.append_token(Token(line_number, *token_info, None, column + column_offset, line_start + column))
+                    if token_info[0] == 8:
+                        self.last_operator = word
+                previous = current_tokens[-1] if current_tokens else None
+                continue
+            else:
+                continue
+            
+            previous = word
+        
+        if previous is not None:
+            current_tokens.append(previous)
+
+class SymbolRecorder:
+    def __init__(self, first_code, calls):
+        self.first_code = first_code
+        self.calls = calls
+        self.placeholder = Symbol(first_code, 0, 0)
+    
+    def add(self, name, line, column=0):
+        self.calls.append((self.first_code, name, column))
+        return self.placeholder
+
+class ScannedLine:
+    __slots__ = ('tokens', 'symbols', 'forbidden', 'malformed', 'consecutive', 'state')
+    
+    def __init__(self, tokens, symbols, forbidden, malformed, state):
+        self.tokens = tokens
+        self.symbols = symbols
+        self.forbidden = forbidden
+        self.malformed = malformed
+        self.consecutive = []
+        self.state = state
+
+def normal_code(type_code, code):
+    if type_code == 4:
+        return code >= 400 and code < 500
+    return code >= 600 and code < 750
+
+class IncrementalScanner:
+    def __init__(self, engine='classic'):
+        self.lexer = scanner_engines[engine]()
+        self.reset()
+    
+    def reset(self):
+        self.lines = []
+        self.entries = []
+        self.line_offset = 0
+        self.text_start = 0
+        self.first_indent = 0
+        self.identifiers = SymbolTable(401)
+        self.constants = SymbolTable(600)
+        self.tables = {401: self.identifiers, 600: self.constants}
+        self.tokens = []
+        self.diagnostics = {
+            'forbidden_line': None,
+            'forbidden_span': None,
+            'malformed_strings': [],
+            'consecutive_constants': []
+        }
+    
+    def analyze_sql(self, sql_query):
+        lines = sql_query.strip().split('\n')
+        leading = len(sql_query) - len(sql_query.lstrip())
+        self.line_offset = sql_query[:leading].count('\n')
+        first_indent = leading - sql_query.rfind('\n', 0, leading) - 1
+        
+        shift = leading - self.text_start
+        if shift:
+            for entry in self.entries:
+                for token in entry.tokens:
+                    token.start += shift
+            self.text_start = leading
+        
+        old_lines = self.lines
+        limit = min(len(old_lines), len(lines))
+        prefix = 0
+        if first_indent != self.first_indent:
+            self.first_indent = first_indent
+            limit = 0
+        while prefix < limit and old_lines[prefix] == lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old_lines[-1 - suffix] == lines[-1 - suffix]:
+            suffix += 1
+        
+        if prefix < len(old_lines) or prefix < len(lines):
+            self.replace_lines(prefix, len(old_lines) - suffix, lines[prefix:len(lines) - suffix])
+        
+        return self.scan_result()
+    
+    def iter_tokens(self, fileobj):
+        tokens = self.lexer.iter_tokens(fileobj)
+        self.diagnostics = self.lexer.diagnostics
+        return tokens
+    
+    def get_token_type_text(self, type_code):
+        return self.lexer.get_token_type_text(type_code)
+    
+    def line_position(self, index):
+        if index == 0:
+            return self.text_start - self.first_indent
+        return self.text_start + sum(len(line) + 1 for line in self.lines[:index])
+    
+    def scan_result(self):
+        entries = self.entries
+        forbidden_line = None
+        forbidden_span = None
+        for index, entry in enumerate(entries):
+            if entry.forbidden is not None:
+                forbidden_line = index + 1 + self.line_offset
+                start = self.line_position(index) + entry.forbidden
+                forbidden_span = (entry.forbidden, start, start + 1)
+                break
+        
+        self.tokens = list(chain.from_iterable(entry.tokens for entry in entries))
+        self.diagnostics = {
+            'forbidden_line': forbidden_line,
+            'forbidden_span': forbidden_span,
+            'malformed_strings': list(chain.from_iterable(entry.malformed for entry in entries)),
+            'consecutive_constants': list(chain.from_iterable(entry.consecutive for entry in entries))
+        }
+        return {
+            'tokens': self.tokens,
+            'identifiers': self.identifiers,
+            'constants': self.constants,
+            'diagnostics': self.diagnostics,
+        }
+    
+    def scan_entry(self, line, line_number, state, line_start):
+        lexer = self.lexer
+        calls = []
+        lexer.line_number = line_number
+        lexer.line_start = line_start
+        lexer.column_offset = self.first_indent if line_number == 1 else 0
+        lexer.last_operator, previous = state
+        lexer.current_tokens = [] if previous is None else [previous]
+        lexer.tokens = []
+        lexer.identifiers = SymbolRecorder(401, calls)
+        lexer.constants = SymbolRecorder(600, calls)
+        lexer.last_token = None
+        lexer.diagnostics = {
+            'forbidden_line': None,
+            'forbidden_span': None,
+            'malformed_strings': [],
+            'consecutive_constants': []
+        }
+        
+        lexer.scan_line(line)
+        
+        forbidden_span = lexer.diagnostics['forbidden_span']
+        state = (lexer.last_operator, lexer.current_tokens[-1] if lexer.current_tokens else None)
+        return ScannedLine(lexer.tokens, calls, None if forbidden_span is None else forbidden_span[0],
+                           lexer.diagnostics['malformed_strings'], state)
+    
+    def scan_entries(self, lines, line_number, state, line_start):
+        entries = []
+        for line in lines:
+            entry = self.scan_entry(line, line_number, state, line_start)
+            entries.append(entry)
+            state = entry.state
+            line_start += len(line) + 1 + (self.first_indent if line_number == 1 else 0)
+            line_number += 1
+        return entries
+    
+    def replace_lines(self, start, stop, new_lines):
+        entries = self.entries
+        lines = list(new_lines)
+        state = entries[start - 1].state if start else (None, None)
+        line_start = self.line_position(start)
+        new_entries = self.scan_entries(lines, start + 1, state, line_start)
+        line_number = start + 1 + len(new_entries)
+        line_start += sum(len(line) + 1 for line in lines) + (self.first_indent if start == 0 and lines else 0)
+        if new_entries:
+            state = new_entries[-1].state
+        
+        while stop < len(entries) and (state != (entries[stop - 1].state if stop else (None, None))
+                                       or (stop == 0) != (start + len(new_entries) == 0)):
+            entry = self.scan_entry(self.lines[stop], line_number, state, line_start)
+            new_entries.append(entry)
+            lines.append(self.lines[stop])
+            state = entry.state
+            line_start += len(self.lines[stop]) + 1 + (self.first_indent if line_number == 1 else 0)
+            line_number += 1
+            stop += 1
+        
+        for line_number, entry in enumerate(entries[start:stop], start + 1):
+            for table_code, name, column in entry.symbols:
+                self.tables[table_code].discard(name, line_number, column)
+        
+        delta = len(new_entries) - (stop - start)
+        shift = sum(len(line) + 1 for line in lines) - sum(len(line) + 1 for line in self.lines[start:stop])
+        if delta:
+            self.identifiers.shift(stop + 1, delta)
+            self.constants.shift(stop + 1, delta)
+        if delta or shift:
+            for entry in entries[stop:]:
+                for token in entry.tokens:
+                    token.line += delta
+                    token.start += shift
+        
+        for line_number, entry in enumerate(new_entries, start + 1):
+            for table_code, name, column in entry.symbols:
+                self.tables[table_code].insert(name, line_number, column)
+        
+        entries[start:stop] = new_entries
+        self.lines[start:stop] = lines
+        
+        renumbered = False
+        for table in (self.identifiers, self.constants):
+            if table.reordered and table.renumber():
+                renumbered = True
+        
+        if renumbered:
+            self.bind_symbols(0, len(entries))
+            self.check_constants(0, len(entries))
+        else:
+            self.bind_symbols(start, start + len(new_entries))
+            self.check_constants(start, start + len(new_entries))
+    
+    def bind_symbols(self, first, last):
+        tables = self.tables
+        for entry in self.entries[first:last]:
+            symbols = iter(entry.symbols)
+            for token in entry.tokens:
+                type_code = token.type
+                if type_code != 4 and type_code != 6:
+                    continue
+                table_code, name, _ = next(symbols)
+                symbol = tables[table_code].symbols[name]
+                code = symbol.code
+                if code != token.code:
+                    if not (normal_code(type_code, code) and normal_code(type_code, token.code)):
+                        token.kind = token_kind(code, token.value)
+                    token.code = code
+                token.extra = symbol.lines
+    
+    def check_constants(self, first, last):
+        entries = self.entries
+        previous = None
+        index = first
+        while index > 0 and previous is None:
+            index -= 1
+            if entries[index].tokens:
+                previous = entries[index].tokens[-1]
+        
+        for index in range(first, len(entries)):
+            entry = entries[index]
+            consecutive = []
+            for token in entry.tokens:
+                if (token.kind == 61 or token.kind == 62) and previous is not None and (previous.kind == 61 or previous.kind == 62):
+                    consecutive.append(token)
+                previous = token
+            entry.consecutive = consecutive
+            if index >= last and entry.tokens:
+                break
+
+def statement_end(line):
+    line = line.rstrip()
+    return line.endswith(';') and line.count("'") % 2 == 0
+
+def scan_chunk(engine, lines, line_number, state, line_start=0, first_indent=0):
+    scanner = IncrementalScanner(engine)
+    scanner.first_indent = first_indent
+    chunk = []
+    for entry in scanner.scan_entries(lines, line_number, state, line_start):
+        tokens = entry.tokens
+        malformed = []
+        if entry.malformed:
+            malformed_ids = {id(token) for token in entry.malformed}
+            malformed = [index for index, token in enumerate(tokens) if id(token) in malformed_ids]
+        rows = [(token.type, token.value, token.code, token.extra if token.type == 1 else None, token.kind,
+                 token.column, token.start)
+                for token in tokens]
+        chunk.append((rows, entry.symbols, entry.forbidden, malformed, entry.state))
+    return chunk
+
+class ParallelScanner(IncrementalScanner):
+    def __init__(self, engine='classic', workers=None, chunk_lines=2000):
+        self.engine = engine
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_lines = chunk_lines
+        self.pool = None
+        super().__init__(engine)
+    
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def split_chunks(self, lines):
+        size = max(self.chunk_lines, -(-len(lines) // self.workers))
+        chunks = []
+        start = 0
+        while start < len(lines):
+            stop = min(start + size, len(lines))
+            while stop < len(lines) and not statement_end(lines[stop - 1]):
+                stop += 1
+            chunks.append((start, stop))
+            start = stop
+        return chunks
+    
+    def replace_lines(self, start, stop, new_lines):
+        lines = list(new_lines)
+        chunks = self.split_chunks(lines)
+        if self.entries or self.workers < 2 or len(chunks) < 2:
+            return super().replace_lines(start, stop, lines)
+        
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(self.workers)
+        
+        line_starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=self.text_start))
+        line_starts[0] -= self.first_indent
+        
+        futures = []
+        for chunk_start, chunk_stop in chunks:
+            state = (None, None) if chunk_start == 0 else (None, ';')
+            futures.append(self.pool.submit(scan_chunk, self.engine, lines[chunk_start:chunk_stop], chunk_start + 1, state,
+                                            line_starts[chunk_start], self.first_indent))
+        
+        entries = []
+        previous = None
+        for (chunk_start, chunk_stop), future in zip(chunks, futures):
+            rows = future.result()
+            
+            if chunk_start > 0:
+                assumed = [(None, ';')] + [row[4] for row in rows]
+                state = entries[-1].state
+                index = 0
+                while index < len(rows) and state != assumed[index]:
+                    rows[index] = scan_chunk(self.engine, [lines[chunk_start + index]], chunk_start + index + 1, state,
+                                             line_starts[chunk_start + index])[0]
+                    state = rows[index][4]
+                    index += 1
+            
+            for line_number, row in enumerate(rows, chunk_start + 1):
+                entry = self.merge_entry(row, line_number, previous)
+                if entry.tokens:
+                    previous = entry.tokens[-1]
+                entries.append(entry)
+        
+        self.entries = entries
+        self.lines = lines
+    
+    def merge_entry(self, row, line_number, previous):
+        token_rows, symbols, forbidden, malformed, state = row
+        tables = self.tables
+        tokens = []
+        consecutive = []
+        symbol_calls = iter(symbols)
+        after_constant = previous is not None and (previous.kind == 61 or previous.kind == 62)
+        
+        for token_row in token_rows:
+            type_code = token_row[0]
+            if type_code != 4 and type_code != 6:
+                tokens.append(Token(line_number, *token_row))
+                after_constant = False
+                continue
+            
+            table_code, name, column = next(symbol_calls)
+            symbol = tables[table_code].add(name, line_number, column)
+            code = symbol.code
+            value = token_row[1]
+            kind = token_row[4] if normal_code(type_code, code) else token_kind(code, value)
+            token = Token(line_number, type_code, value, code, symbol.lines, kind, token_row[5], token_row[6])
+            tokens.append(token)
+            
+            if kind == 61 or kind == 62:
+                if after_constant:
+                    consecutive.append(token)
+                after_constant = True
+            else:
+                after_constant = False
+        
+        entry = ScannedLine(tokens, symbols, forbidden, [tokens[index] for index in malformed], state)
+        entry.consecutive = consecutive
+        return entry
+
+scanner_engines = {
+    'classic': DMLScanner,
+    'regex': RegexDMLScanner
+}
 
 def format_tokens(tokens):
     result = []
@@ -1,4 +1,5 @@
-from core.scanner_dml import reserved_words, delimiters, operators, relational_operators, constants
+from core.scanner_dml import reserved_words, delimiters, operators, relational_operators, constants, malformed_string
+from core.syntax_tree import build_tree, walk, Select, CreateTable, ColumnRef, Literal, Comparison, InSubquery
 
 ERROR_CODES = {
     101: "Símbolo desconocido.",
@@ -10,6 +11,8 @@ ERROR_CODES = {
     206: "Se esperaba Constante.",
     207: "Se esperaba Operador.",
     208: "Se esperaba Operador Relacional.",
+    209: "Sentencia demasiado larga.",
+    210: "Demasiados niveles de subconsultas anidadas.",
     
     311: "Columna no encontrada.",
     312: "Atributo ambiguo.",
@@ -22,10 +25,25 @@ ERROR_CODES = {
     319: "Tabla no existe en condición WHERE."
 }
 
+class ErrorMessage(str):
+    def __new__(cls, text, code=None, line=None, column=None, start=None, end=None):
+        message = super().__new__(cls, text)
+        message.code = code
+        message.line = line
+        message.column = column
+        message.start = start
+        message.end = end
+        return message
+    
+    def with_prefix(self, prefix):
+        return ErrorMessage(prefix + self, self.code, self.line, self.column, self.start, self.end)
+
+    def relocated(self, line, span):
+        text = self.replace(f" Línea {self.line:02d}. ", f" Línea {line:02d}. ", 1)
+        return ErrorMessage(text, self.code, line, *span)
+
 class SyntaxErrorHandler:
     def __init__(self):
-        self.forbidden_chars = ['&', '@', '$', '!', '^', '%', '?', '~', '|', '\\', '`', '"']
-        
         self.valid_data_types = [
             "NUMERIC", "INT", "INTEGER", "SMALLINT", "BIGINT", "DECIMAL", "FLOAT", 
             "REAL", "CHAR", "VARCHAR", "TEXT", "DATE", "TIME", "TIMESTAMP", 
@@ -125,9 +143,25 @@ class SyntaxErrorHandler:
             317: "CONECTOR_LOGICO",
             318: "CONSTANTE",
             319: "VALOR_NUMERICO",
-            320: "DISTINCT_OPT"
+            320: "DISTINCT_OPT",
+            321: "SUBCONSULTA"
         }
         
+        self.symbol_names = dict(self.nonterminal_names)
+        for word, (_, word_code) in reserved_words.items():
+            self.symbol_names.setdefault(word_code, word)
+        for delim, delim_code in delimiters.items():
+            self.symbol_names.setdefault(delim_code, f"'{delim}'")
+        for op, op_code in operators.items():
+            self.symbol_names.setdefault(op_code, f"'{op}'")
+        for rel_op, rel_op_code in relational_operators.items():
+            self.symbol_names.setdefault(rel_op_code, f"'{rel_op}'")
+        self.symbol_names.setdefault(4, "IDENTIFICADOR")
+        self.symbol_names.setdefault(61, "CONSTANTE")
+        self.symbol_names.setdefault(62, "CONSTANTE")
+        self.symbol_names.setdefault(99, "EPSILON")
+        self.symbol_names.setdefault(199, "FIN_DE_ENTRADA")
+        
         self.and_code = None
         self.or_code = None
         self.where_code = None
@@ -177,62 +211,21 @@ class SyntaxErrorHandler:
         }
 
     def get_token_type(self, token_info):
-        code = token_info[1][2]
-        
-        if (code >= 400 and code < 500):
-            return 4
-        
-        if (code >= 600 and code < 750):
-            token_value = token_info[1][1]
-            if token_value.startswith("'") and token_value.endswith("'"):
-                return 62
-            else:
-                try:
-                    float(token_value)
-                    return 61
-                except:
-                    return 62
-            
-        return code
+        return token_info.kind
     
     def is_terminal(self, symbol):
         return (symbol < 200 and symbol != 99) or symbol == 199
     
     def get_symbol_name(self, code):
-        if code in self.nonterminal_names:
-            return self.nonterminal_names[code]
-        
-        for word, (_, word_code) in reserved_words.items():
-            if word_code == code:
-                return word
-                
-        for delim, delim_code in delimiters.items():
-            if delim_code == code:
-                return f"'{delim}'"
-                
-        for op, op_code in operators.items():
-            if op_code == code:
-                return f"'{op}'"
-                
-        for rel_op, rel_op_code in relational_operators.items():
-            if rel_op_code == code:
-                return f"'{rel_op}'"
-                
-        if code == 4:
-            return "IDENTIFICADOR"
-        elif code == 61 or code == 62:
-            return "CONSTANTE"
-        elif code == 99:
-            return "EPSILON"
-        elif code == 199:
-            return "FIN_DE_ENTRADA"
-            
-        return str(code)
+        name = self.symbol_names.get(code)
+        if name is None:
+            return str(code)
+        return name
     
     def array_to_string(self, arr):
         return " ".join([self.get_symbol_name(x) for x in arr])
     
-    def format_error_message(self, error_code, line, custom_message=None):
+    def format_error_message(self, error_code, line, custom_message=None, span=None):
         if error_code == 101:
             error_type = "1"
         elif error_code >= 300 and error_code < 400:
@@ -244,12 +237,16 @@ class SyntaxErrorHandler:
         
         message = custom_message if custom_message else ERROR_CODES[error_code]
         
-        return f"{error_type}:{error_code} Línea {line_formatted}. {message}"
+        text = f"{error_type}:{error_code} Línea {line_formatted}. {message}"
+        
+        if span is None:
+            return ErrorMessage(text, error_code, line)
+        return ErrorMessage(text, error_code, line, *span)
 
     def get_error_code_by_context(self, symbol, K=None, current_context=None, prev_token_type=None, 
                                   prev_token=None, last_id_token=None, tokens=None, current_token_index=None):
         if current_context == 'IN_SUBQUERY' and K == 53:
-            return 99
+            return 201
             
         if current_context == 'MISSING_IN' or (prev_token_type == 4 and K == 52):
             return 201
@@ -379,29 +376,31 @@ class SyntaxErrorHandler:
         return 201
     
     def classify_terminal_error(self, X, K, line, tokens, current_token_index, prev_token_type=None, current_context=None, last_id_token=None, prev_token=None):
+        span = tokens[current_token_index].span
+        
         if X == 17 and K == 4:
-            return self.format_error_message(201, line)
+            return self.format_error_message(201, line, span=span)
             
         if X == 4 and K == 52 and current_context == 'CREATE_TABLE':
-            return self.format_error_message(204, line)
+            return self.format_error_message(204, line, span=span)
             
         if X == 17 and prev_token == self.create_code:
-            return self.format_error_message(201, line)
+            return self.format_error_message(201, line, span=span)
             
         if X == 28 and prev_token == self.insert_code:
-            return self.format_error_message(201, line)
+            return self.format_error_message(201, line, span=span)
             
         if X == 28:
-            return self.format_error_message(201, line)
+            return self.format_error_message(201, line, span=span)
             
         if prev_token_type == 4 and K == 52:
-            return self.format_error_message(201, line)
+            return self.format_error_message(201, line, span=span)
         
         if prev_token_type in [61, 62] and K in [61, 62] and current_context == 'INSERT_VALUES':
-            return self.format_error_message(205, line)
+            return self.format_error_message(205, line, span=span)
 
         if X == 55 and K == 53 and current_context in ['IN_SUBQUERY', 'WHERE_CONDITION']:
-            return self.format_error_message(205, line)
+            return self.format_error_message(205, line, span=span)
             
         if K in [61, 62] and prev_token_type == 4:
             error_code = 208
@@ -409,23 +408,25 @@ class SyntaxErrorHandler:
             error_code = self.get_error_code_by_context(X, K, current_context, prev_token_type, 
                                                         prev_token, last_id_token, tokens, current_token_index)
         
-        return self.format_error_message(error_code, line)
+        return self.format_error_message(error_code, line, span=span)
     
     def classify_nonterminal_error(self, X, K, line, tokens, current_token_index, prev_token_type=None, current_context=None, last_id_token=None, prev_token=None):
+        span = tokens[current_token_index].span
+        
         if current_context == 'CONSTRAINT' and X == 218 and K == 53 and prev_token == 52:
-            return self.format_error_message(204, line)
+            return self.format_error_message(204, line, span=span)
             
         if current_context == 'CONSTRAINT' and X == 209 and (K == 199 or K not in [50, 53]):
-            return self.format_error_message(205, line)
+            return self.format_error_message(205, line, span=span)
         
         if X in [205, 206, 217] and K == 199 and prev_token in [20, 21, 23, 24, 25]:
-            return self.format_error_message(205, line)
+            return self.format_error_message(205, line, span=span)
             
         if current_context == 'CONSTRAINT' and X == 209 and K == 55:
-            return self.format_error_message(205, line)
+            return self.format_error_message(205, line, span=span)
             
         if prev_token_type == 4 and K == 52:
-            return self.format_error_message(201, line)
+            return self.format_error_message(201, line, span=span)
             
         if K in [61, 62] and prev_token_type == 4:
             error_code = 208
@@ -433,55 +434,28 @@ class SyntaxErrorHandler:
             error_code = self.get_error_code_by_context(X, K, current_context, prev_token_type, 
                                                         prev_token, last_id_token, tokens, current_token_index)
         
-        return self.format_error_message(error_code, line)
+        return self.format_error_message(error_code, line, span=span)
     
     def check_malformed_strings(self, tokens):
-        for idx, token_info in enumerate(tokens):
-            line = token_info[0]
-            token_data = token_info[1]
-            token_text = token_data[1]
+        for token_info in tokens:
+            token_text = token_info.value
             
-            if token_text == "$" or token_text == "EOF" or token_data[2] == 199:
+            if token_text == "$" or token_text == "EOF" or token_info.code == 199:
                 continue
             
-            if token_text == "''":
-                continue
-                
-            if token_text == "'":
-                return self.format_error_message(205, line)
-                
-            if token_text.startswith("'") and not token_text.endswith("'"):
-                return self.format_error_message(205, line)
-                
-            if token_text.endswith("'") and not token_text.startswith("'"):
-                return self.format_error_message(205, line)
-                
-            if token_text.startswith("'") and token_text.endswith("'") and len(token_text) > 2:
-                content = token_text[1:-1]
-                i = 0
-                while i < len(content):
-                    if i < len(content) - 1 and content[i:i+2] == "''":
-                        i += 2
-                    else:
-                        if content[i] == "'":
-                            return self.format_error_message(205, line)
-                        i += 1
-                        
-            if token_text.count("'") > 2 and token_text.startswith("'") and token_text.endswith("'"):
-                inner_content = token_text[1:-1]
-                if inner_content.count("'") % 2 != 0:
-                    return self.format_error_message(205, line)
+            if malformed_string(token_text):
+                return self.format_error_message(205, token_info.line, span=token_info.span)
         
         return None
 
     def check_insert_into_sequence(self, tokens):
         if len(tokens) > 1:
-            first_token_value = tokens[0][1][1].upper()
-            second_token_value = tokens[1][1][1].upper()
+            first_token_value = tokens[0].value.upper()
+            second_token_value = tokens[1].value.upper()
             
             if first_token_value == "INSERT" and second_token_value != "INTO":
-                line = tokens[1][0]
-                return self.format_error_message(201, line)
+                line = tokens[1].line
+                return self.format_error_message(201, line, span=tokens[1].span)
         
         return None
     
@@ -494,184 +468,64 @@ class SyntaxErrorHandler:
             next_type = get_token_type_fn(next_token)
             
             if (current_type in [61, 62] and next_type in [61, 62]):
-                line = next_token[0]
-                return self.format_error_message(205, line)
+                line = next_token.line
+                return self.format_error_message(205, line, span=next_token.span)
         
         return None
         
-    def check_forbidden_characters(self, sql_query):
-        lines = sql_query.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            inside_quotes = False
-            i = 0
-            
-            while i < len(line):
-                char = line[i]
-                
-                if char == "'":
-                    inside_quotes = not inside_quotes
-                
-                if not inside_quotes and char in self.forbidden_chars:
-                    return self.format_error_message(101, line_num)
-                
-                i += 1
-            
-            if inside_quotes:
-                pass
-                
-        return None
-        
-    def validate_select_tables(self, tokens, tables_info):
+    def validate_select_tables(self, tokens, tables_info, tree=None):
         if not tables_info:
             return None
         
-        from_index = -1
-        tables = []
-        
-        for i in range(len(tokens)):
-            token_info = tokens[i]
-            token_value = token_info[1][1].upper()
-            token_type = self.get_token_type(token_info)
-            
-            if token_type == 11:
-                from_index = i
-                break
+        if tree is None:
+            tree = build_tree(tokens)
+        if not isinstance(tree, Select) or not tree.tables:
+            return None
         
-        if from_index >= 0 and from_index + 1 < len(tokens):
-            i = from_index + 1
-            while i < len(tokens):
-                token_info = tokens[i]
-                token_value = token_info[1][1]
-                token_type = self.get_token_type(token_info)
-                
-                if token_type == 12:
-                    break
-                
-                if token_type == 4:
-                    tables.append(token_value)
-                    i += 1
-                    
-                    if i < len(tokens) and self.get_token_type(tokens[i]) == 4:
-                        i += 1
-                    
-                    if i < len(tokens) and tokens[i][1][1] == ',':
-                        i += 1
-                        continue
-                    elif i < len(tokens) and self.get_token_type(tokens[i]) != 12:
-                        break
-                else:  
+        for table in tree.tables:
+            table_name = table.name.value
+            table_exists = False
+            for table_info in tables_info:
+                if table_info['name'].upper() == table_name.upper():
+                    table_exists = True
                     break
             
-            for table_name in tables:
-                table_exists = False
-                for table_info in tables_info:
-                    if table_info['name'].upper() == table_name.upper():
-                        table_exists = True
-                        break
-                
-                if not table_exists:
-                    line = tokens[from_index + 1][0]
-                    error_msg = self.format_error_message(314, line, f"La tabla '{table_name}' no existe en la base de datos.")
-                    return {
-                        "status": "error", 
-                        "message": "Se encontraron errores semánticos en SELECT", 
-                        "errors": [error_msg]
-                    }
+            if not table_exists:
+                first_table = tree.tables[0].name
+                error_msg = self.format_error_message(314, first_table.line, f"La tabla '{table_name}' no existe en la base de datos.", first_table.span)
+                return {
+                    "status": "error", 
+                    "message": "Se encontraron errores semánticos en SELECT", 
+                    "errors": [error_msg]
+                }
         
         return None
     
-    def validate_select_columns(self, tokens, tables_info):
+    def validate_select_columns(self, tokens, tables_info, tree=None):
         if not tables_info:
             return None
         
-        from_index = -1
+        if tree is None:
+            tree = build_tree(tokens)
+        if not isinstance(tree, Select) or not tree.columns:
+            return None
+        
         tables = []
         table_aliases = {}
+        for table in tree.tables:
+            tables.append(table.name.value)
+            if table.alias:
+                table_aliases[table.alias.value.upper()] = table.name.value.upper()
         
-        for i in range(len(tokens)):
-            token_info = tokens[i]
-            token_value = token_info[1][1].upper()
-            token_type = self.get_token_type(token_info)
-            
-            if token_type == 11:
-                from_index = i
-                break
-        
-        if from_index >= 0 and from_index + 1 < len(tokens):
-            i = from_index + 1
-            while i < len(tokens):
-                token_info = tokens[i]
-                token_value = token_info[1][1]
-                token_type = self.get_token_type(token_info)
-                
-                if token_type == 12:
-                    break
-                
-                if token_type == 4:
-                    table_name = token_value
-                    tables.append(table_name)
-                    i += 1
-                    
-                    if i < len(tokens) and self.get_token_type(tokens[i]) == 4:
-                        alias = tokens[i][1][1]
-                        table_aliases[alias.upper()] = table_name.upper()
-                        i += 1
-                    
-                    if i < len(tokens) and tokens[i][1][1] == ',':
-                        i += 1
-                        continue
-                    elif i < len(tokens) and self.get_token_type(tokens[i]) != 12:
-                        break
-                else:  
-                    break
-        
-        columns = []
-        select_index = -1
-        
-        for i in range(len(tokens)):
-            token_info = tokens[i]
-            token_value = token_info[1][1].upper()
-            token_type = self.get_token_type(token_info)
-            
-            if token_type == 10:
-                select_index = i
-                break
-        
-        if select_index >= 0 and select_index + 1 < len(tokens) and from_index > select_index:
-            i = select_index + 1
-            
-            if i < len(tokens) and self.get_token_type(tokens[i]) == 30:
-                i += 1
-            
-            while i < from_index:
-                token_info = tokens[i]
-                token_value = token_info[1][1]
-                token_type = self.get_token_type(token_info)
-                
-                if token_type == 4 or token_value == '*':
-                    column = token_value
-                    
-                    if i + 2 < from_index and tokens[i+1][1][1] == '.' and self.get_token_type(tokens[i+2]) == 4:
-                        table_name = token_value
-                        column = tokens[i+2][1][1]
-                        columns.append((table_name, column))
-                        i += 3
-                    else:
-                        columns.append((None, column))
-                        i += 1
-                    
-                    if i < from_index and tokens[i][1][1] == ',':
-                        i += 1
-                        continue
-                else:
-                    i += 1
+        first_token = tree.distinct or tree.columns[0].token
         
-        for table_name, column_name in columns:
+        for column in tree.columns:
+            column_name = column.column.value
             if column_name == '*':
                 continue
             
-            if table_name:
+            if column.table:
+                table_name = column.table.value
                 if table_name.upper() in table_aliases:
                     table_name = table_aliases[table_name.upper()]
                 
@@ -686,8 +540,7 @@ class SyntaxErrorHandler:
                                 break
                         
                         if not column_found:
-                            line = tokens[select_index + 1][0]
-                            error_msg = self.format_error_message(311, line, f"La columna '{column_name}' no existe en la tabla '{table_name}'.")
+                            error_msg = self.format_error_message(311, first_token.line, f"La columna '{column_name}' no existe en la tabla '{table_name}'.", first_token.span)
                             return {
                                 "status": "error", 
                                 "message": "Se encontraron errores semánticos en SELECT", 
@@ -696,15 +549,13 @@ class SyntaxErrorHandler:
                         break
                 
                 if not table_found:
-                    line = tokens[select_index + 1][0]
-                    error_msg = self.format_error_message(314, line, f"La tabla '{table_name}' no existe en la base de datos.")
+                    error_msg = self.format_error_message(314, first_token.line, f"La tabla '{table_name}' no existe en la base de datos.", first_token.span)
                     return {
                         "status": "error", 
                         "message": "Se encontraron errores semánticos en SELECT", 
                         "errors": [error_msg]
                     }
             else:
-                column_found = False
                 tables_with_column = []
                 
                 for table_name in tables:
@@ -712,13 +563,11 @@ class SyntaxErrorHandler:
                         if table_info['name'].upper() == table_name.upper():
                             for attr in table_info['attributes']:
                                 if attr['name'].upper() == column_name.upper():
-                                    column_found = True
                                     tables_with_column.append(table_info['name'])
                                     break
-                                    
+                
                 if len(tables_with_column) > 1:
-                    line = tokens[select_index + 1][0]
-                    error_msg = self.format_error_message(312, line, f"La columna '{column_name}' es ambigua. Existe en las tablas: {', '.join(tables_with_column)}.")
+                    error_msg = self.format_error_message(312, first_token.line, f"La columna '{column_name}' es ambigua. Existe en las tablas: {', '.join(tables_with_column)}.", first_token.span)
                     return {
                         "status": "error", 
                         "message": "Se encontraron errores semánticos en SELECT", 
@@ -727,18 +576,13 @@ class SyntaxErrorHandler:
         
         return None
     
-    def validate_type_conversions(self, tokens, tables_info):
+    def validate_type_conversions(self, tokens, tables_info, tree=None):
         if not tables_info:
             return None
-            
-        is_select_query = False
-        for token_info in tokens:
-            token_type = self.get_token_type(token_info)
-            if token_type == 10:
-                is_select_query = True
-                break
-                
-        if not is_select_query:
+        
+        if tree is None:
+            tree = build_tree(tokens)
+        if not isinstance(tree, Select):
             return None
         
         numeric_types = ['INTEGER', 'INT', 'SMALLINT', 'TINYINT', 'BIGINT', 'DECIMAL', 'NUMERIC',
@@ -787,302 +631,250 @@ class SyntaxErrorHandler:
                 column_types[column_key] = column_type
                 column_types[column_name] = column_type
         
-        where_index = -1
-        for i in range(len(tokens)):
-            if self.get_token_type(tokens[i]) == 12:
-                where_index = i
-                break
-                
-        if where_index < 0:
+        def type_category(data_type):
+            if data_type in numeric_types:
+                return 'numeric'
+            if data_type in string_types:
+                return 'string'
+            if data_type in date_types:
+                return 'date'
+            if data_type == 'BOOLEAN':
+                return 'boolean'
             return None
-            
-        i = where_index + 1
         
-        while i < len(tokens) - 2:
-            if self.get_token_type(tokens[i]) == 4:
-                left_operand = tokens[i][1][1].upper()
-                left_type_category = None
-                
-                if i + 2 < len(tokens) and tokens[i+1][1][1] == '.' and self.get_token_type(tokens[i+2]) == 4:
-                    table_name = left_operand
-                    column_name = tokens[i+2][1][1].upper()
-                    left_operand = f"{table_name}.{column_name}"
-                    i += 2
-                
-                left_data_type = column_types.get(left_operand)
-                
-                if left_data_type:
-                    if left_data_type in numeric_types:
-                        left_type_category = 'numeric'
-                    elif left_data_type in string_types:
-                        left_type_category = 'string'
-                    elif left_data_type in date_types:
-                        left_type_category = 'date'
-                    elif left_data_type == 'BOOLEAN':
-                        left_type_category = 'boolean'
-                else:
-                    i += 1
-                    continue
-                
-                if i + 1 < len(tokens) and self.get_token_type(tokens[i+1]) in self.operadores_relacionales:
-                    operator = tokens[i+1][1][1]
-                    i += 1
-                    
-                    if i + 1 < len(tokens):
-                        i += 1
-                        right_token = tokens[i]
-                        right_token_type = self.get_token_type(right_token)
-                        right_operand = right_token[1][1]
-                        right_type_category = None
-                        
-                        if right_token_type == 61:
-                            right_type_category = 'numeric'
-                        elif right_token_type == 62:
-                            right_type_category = 'string'
-                        elif right_token_type == 4:
-                            if i + 2 < len(tokens) and tokens[i+1][1][1] == '.' and self.get_token_type(tokens[i+2]) == 4:
-                                right_table = right_operand
-                                right_column = tokens[i+2][1][1].upper()
-                                right_operand = f"{right_table}.{right_column}"
-                                i += 2
-                            
-                            right_data_type = column_types.get(right_operand.upper())
-                            
-                            if right_data_type:
-                                if right_data_type in numeric_types:
-                                    right_type_category = 'numeric'
-                                elif right_data_type in string_types:
-                                    right_type_category = 'string'
-                                elif right_data_type in date_types:
-                                    right_type_category = 'date'
-                                elif right_data_type == 'BOOLEAN':
-                                    right_type_category = 'boolean'
-                            else:
-                                right_type_category = 'string'
-                        
-                        if left_type_category and right_type_category and left_type_category != right_type_category:
-                            if not type_compatibility.get(left_type_category, {}).get(right_type_category, False):
-                                line = right_token[0]
-                                error_msg = self.format_error_message(313, line, 
-                                    f"Error de conversión al convertir el valor del atributo '{left_operand}' del tipo {left_type_category} a tipo de dato {right_type_category}.")
-                                
-                                return {
-                                    "status": "error", 
-                                    "message": "Se encontraron errores semánticos en la conversión de tipos", 
-                                    "errors": [error_msg]
-                                }
-                    i += 1
+        for predicate in walk(tree):
+            if not isinstance(predicate, Comparison):
+                continue
+            
+            left_operand = predicate.left.name.upper()
+            left_data_type = column_types.get(left_operand)
+            if not left_data_type:
+                continue
+            left_type_category = type_category(left_data_type)
+            
+            right = predicate.right
+            right_type_category = None
+            if isinstance(right, Literal):
+                if right.token.kind == 61:
+                    right_type_category = 'numeric'
+                elif right.token.kind == 62:
+                    right_type_category = 'string'
+            elif isinstance(right, ColumnRef):
+                right_data_type = column_types.get(right.name.upper())
+                if right_data_type:
+                    right_type_category = type_category(right_data_type)
                 else:
-                    i += 1
-            else:
-                i += 1
-        
-        return None
-
-    def validate_create_table_constraints(self, tokens):
-        constraint_names = []
-        
-        for i in range(len(tokens) - 1):
-            token_info = tokens[i]
-            token_value = token_info[1][1].upper()
+                    right_type_category = 'string'
             
-            if token_value == 'CONSTRAINT' and i + 1 < len(tokens):
-                constraint_name = tokens[i+1][1][1]
-                
-                if constraint_name in constraint_names:
-                    line = tokens[i+1][0]
-                    error_msg = self.format_error_message(315, line, 
-                                f"El nombre de restricción '{constraint_name}' está duplicado.")
+            if left_type_category and right_type_category and left_type_category != right_type_category:
+                if not type_compatibility.get(left_type_category, {}).get(right_type_category, False):
+                    right_token = right.token
+                    error_msg = self.format_error_message(313, right_token.line, 
+                        f"Error de conversión al convertir el valor del atributo '{left_operand}' del tipo {left_type_category} a tipo de dato {right_type_category}.", right_token.span)
+                    
                     return {
                         "status": "error", 
-                        "message": "Se encontraron errores semánticos en CREATE TABLE", 
+                        "message": "Se encontraron errores semánticos en la conversión de tipos", 
                         "errors": [error_msg]
                     }
-                    
-                constraint_names.append(constraint_name)
         
         return None
+    
+    def validate_create_table_constraints(self, tokens, tree=None):
+        if tree is None:
+            tree = build_tree(tokens)
+        if not isinstance(tree, CreateTable):
+            return None
+        
+        constraint_names = []
         
-    def validate_where_conditions(self, tokens, tables_info):
+        for constraint in tree.constraints:
+            if constraint.name is None:
+                continue
+            constraint_name = constraint.name.value
+            
+            if constraint_name in constraint_names:
+                error_msg = self.format_error_message(315, constraint.name.line, 
+                            f"El nombre de restricción '{constraint_name}' está duplicado.", constraint.name.span)
+                return {
+                    "status": "error", 
+                    "message": "Se encontraron errores semánticos en CREATE TABLE", 
+                    "errors": [error_msg]
+                }
+            
+            constraint_names.append(constraint_name)
+        
+        return None
+    
+    def validate_where_conditions(self, tokens, tables_info, tree=None):
         if not tables_info:
             return None
+        
+        if tree is None:
+            tree = build_tree(tokens)
+        if not isinstance(tree, Select) or tree.where is None:
+            return None
+        
+        for node in walk(tree):
+            if isinstance(node, Select):
+                if node is tree:
+                    continue
+                references = [column for column in node.columns if column.column.kind == 4]
+                for table in node.tables:
+                    references.append(ColumnRef(table.name))
+                    if table.alias:
+                        references.append(ColumnRef(table.alias))
+            elif isinstance(node, Comparison):
+                references = [node.left]
+            elif isinstance(node, InSubquery):
+                references = [node.left]
+            elif isinstance(node, ColumnRef):
+                references = [node]
+            else:
+                continue
             
-        where_index = -1
-        for i in range(len(tokens)):
-            token_info = tokens[i]
-            token_value = token_info[1][1].upper()
-            token_type = self.get_token_type(token_info)
+            for reference in references:
+                error_result = self._validate_where_reference(reference, tables_info)
+                if error_result:
+                    return error_result
             
-            if token_type == 12:
-                where_index = i
-                break
-                
-        if where_index < 0 or where_index + 1 >= len(tokens):
-            return None
+            if isinstance(node, Comparison):
+                if node.left.table:
+                    error_result = self._validate_where_operand(node.right, tables_info)
+                elif isinstance(node.right, ColumnRef):
+                    error_result = self._validate_where_reference(node.right, tables_info)
+                else:
+                    error_result = None
+                if error_result:
+                    return error_result
+        
+        return None
+    
+    def _validate_where_reference(self, reference, tables_info):
+        token_info = reference.token
+        
+        if reference.table:
+            table_name = reference.table.value
+            column_name = reference.column.value
             
-        i = where_index + 1
-        while i < len(tokens):
-            token_info = tokens[i]
-            token_value = token_info[1][1]
-            token_type = self.get_token_type(token_info)
+            table_exists = False
+            for table_info in tables_info:
+                if table_info['name'].upper() == table_name.upper():
+                    table_exists = True
+                    break
             
-            if token_type == 4:
-                if i + 2 < len(tokens) and tokens[i+1][1][1] == '.' and self.get_token_type(tokens[i+2]) == 4:
-                    table_name = token_value
-                    column_name = tokens[i+2][1][1]
-                    
-                    table_exists = False
-                    for table_info in tables_info:
-                        if table_info['name'].upper() == table_name.upper():
-                            table_exists = True
-                            break
-                    
-                    if not table_exists:
-                        line = token_info[0]
-                        error_msg = self.format_error_message(319, line, 
-                                    f"El identificador \"{table_name}.{column_name}\" no es válido. Tabla no encontrada.")
-                        return {
-                            "status": "error", 
-                            "message": "Se encontraron errores semánticos en la cláusula WHERE", 
-                            "errors": [error_msg]
-                        }
-                    
-                    column_exists = False
-                    for table_info in tables_info:
-                        if table_info['name'].upper() == table_name.upper():
-                            for attr in table_info['attributes']:
-                                if attr['name'].upper() == column_name.upper():
-                                    column_exists = True
-                                    break
+            if not table_exists:
+                error_msg = self.format_error_message(319, token_info.line, 
+                            f"El identificador \"{table_name}.{column_name}\" no es válido. Tabla no encontrada.", token_info.span)
+                return {
+                    "status": "error", 
+                    "message": "Se encontraron errores semánticos en la cláusula WHERE", 
+                    "errors": [error_msg]
+                }
+            
+            column_exists = False
+            for table_info in tables_info:
+                if table_info['name'].upper() == table_name.upper():
+                    for attr in table_info['attributes']:
+                        if attr['name'].upper() == column_name.upper():
+                            column_exists = True
                             break
-                    
-                    if not column_exists:
-                        line = token_info[0]
-                        error_msg = self.format_error_message(311, line, 
-                                    f"La columna '{column_name}' no existe en la tabla '{table_name}'.")
-                        return {
-                            "status": "error", 
-                            "message": "Se encontraron errores semánticos en la cláusula WHERE", 
-                            "errors": [error_msg]
-                        }
-                    
-                    if '#' in column_name:
-                        line = token_info[0]
-                        error_msg = self.format_error_message(318, line, 
-                                    f"El nombre del atributo \"{column_name}\" no es válido.")
-                        return {
-                            "status": "error", 
-                            "message": "Se encontraron errores semánticos en la cláusula WHERE", 
-                            "errors": [error_msg]
-                        }
-                    
-                    i += 3
-                    
-                    if i < len(tokens) and self.get_token_type(tokens[i]) in self.operadores_relacionales:
-                        operator = tokens[i][1][1]
-                        i += 1
-                        
-                        if i < len(tokens):
-                            right_token = tokens[i]
-                            right_type = self.get_token_type(right_token)
-                            right_value = right_token[1][1]
-                            
-                            if right_type == 4:
-                                if i + 2 < len(tokens) and tokens[i+1][1][1] == '.' and self.get_token_type(tokens[i+2]) == 4:
-                                    right_table = right_value
-                                    right_column = tokens[i+2][1][1]
-                                    
-                                    table_exists = False
-                                    for table_info in tables_info:
-                                        if table_info['name'].upper() == right_table.upper():
-                                            table_exists = True
-                                            break
-                                    
-                                    if not table_exists:
-                                        line = right_token[0]
-                                        error_msg = self.format_error_message(319, line, 
-                                                    f"El identificador \"{right_table}.{right_column}\" no es válido. Tabla no encontrada.")
-                                        return {
-                                            "status": "error", 
-                                            "message": "Se encontraron errores semánticos en la cláusula WHERE", 
-                                            "errors": [error_msg]
-                                        }
-                                    
-                                    column_exists = False
-                                    for table_info in tables_info:
-                                        if table_info['name'].upper() == right_table.upper():
-                                            for attr in table_info['attributes']:
-                                                if attr['name'].upper() == right_column.upper():
-                                                    column_exists = True
-                                                    break
-                                            break
-                                    
-                                    if not column_exists:
-                                        line = right_token[0]
-                                        error_msg = self.format_error_message(311, line, 
-                                                    f"La columna '{right_column}' no existe en la tabla '{right_table}'.")
-                                        return {
-                                            "status": "error", 
-                                            "message": "Se encontraron errores semánticos en la cláusula WHERE", 
-                                            "errors": [error_msg]
-                                        }
-                                    
-                                    i += 3
-                                else:
-                                    is_valid_column = False
-                                    
-                                    for table_info in tables_info:
-                                        for attr in table_info['attributes']:
-                                            if attr['name'].upper() == right_value.upper():
-                                                is_valid_column = True
-                                                break
-                                        if is_valid_column:
-                                            break
-                                    
-                                    if not is_valid_column:
-                                        line = right_token[0]
-                                        error_msg = self.format_error_message(312, line, 
-                                                    f"El nombre del atributo \"{right_value}\" no es válido.")
-                                        return {
-                                            "status": "error", 
-                                            "message": "Se encontraron errores semánticos en la cláusula WHERE", 
-                                            "errors": [error_msg]
-                                        }
-                                    
-                                    i += 1
-                            elif right_type == 62:
-                                if not (right_value.startswith("'") and right_value.endswith("'")):
-                                    line = right_token[0]
-                                    error_msg = self.format_error_message(205, line, 
-                                                f"Error de sintaxis: el literal de texto '{right_value}' debe estar entre comillas simples.")
-                                    return {
-                                        "status": "error", 
-                                        "message": "Se encontraron errores de sintaxis en la cláusula WHERE", 
-                                        "errors": [error_msg]
-                                    }
-                                i += 1
-                            else:
-                                i += 1
-                        else:
-                            break
-                    
-                else:
-                    column_name = token_value
-                    
-                    if '#' in column_name:
-                        line = token_info[0]
-                        error_msg = self.format_error_message(318, line, 
-                                    f"El nombre del atributo \"{column_name}\" no es válido.")
-                        return {
-                            "status": "error", 
-                            "message": "Se encontraron errores semánticos en la cláusula WHERE", 
-                            "errors": [error_msg]
-                        }
-                    
-                    i += 1
+                    break
+            
+            if not column_exists:
+                error_msg = self.format_error_message(311, token_info.line, 
+                            f"La columna '{column_name}' no existe en la tabla '{table_name}'.", token_info.span)
+                return {
+                    "status": "error", 
+                    "message": "Se encontraron errores semánticos en la cláusula WHERE", 
+                    "errors": [error_msg]
+                }
+        else:
+            column_name = reference.column.value
+        
+        if '#' in column_name:
+            error_msg = self.format_error_message(318, token_info.line, 
+                        f"El nombre del atributo \"{column_name}\" no es válido.", token_info.span)
+            return {
+                "status": "error", 
+                "message": "Se encontraron errores semánticos en la cláusula WHERE", 
+                "errors": [error_msg]
+            }
+        
+        return None
+    
+    def _validate_where_operand(self, operand, tables_info):
+        if isinstance(operand, ColumnRef):
+            right_token = operand.token
+            right_value = right_token.value
+            
+            if operand.table:
+                right_table = operand.table.value
+                right_column = operand.column.value
+                
+                table_exists = False
+                for table_info in tables_info:
+                    if table_info['name'].upper() == right_table.upper():
+                        table_exists = True
+                        break
+                
+                if not table_exists:
+                    error_msg = self.format_error_message(319, right_token.line, 
+                                f"El identificador \"{right_table}.{right_column}\" no es válido. Tabla no encontrada.", right_token.span)
+                    return {
+                        "status": "error", 
+                        "message": "Se encontraron errores semánticos en la cláusula WHERE", 
+                        "errors": [error_msg]
+                    }
+                
+                column_exists = False
+                for table_info in tables_info:
+                    if table_info['name'].upper() == right_table.upper():
+                        for attr in table_info['attributes']:
+                            if attr['name'].upper() == right_column.upper():
+                                column_exists = True
+                                break
+                        break
+                
+                if not column_exists:
+                    error_msg = self.format_error_message(311, right_token.line, 
+                                f"La columna '{right_column}' no existe en la tabla '{right_table}'.", right_token.span)
+                    return {
+                        "status": "error", 
+                        "message": "Se encontraron errores semánticos en la cláusula WHERE", 
+                        "errors": [error_msg]
+                    }
             else:
-                i += 1
+                is_valid_column = False
                 
+                for table_info in tables_info:
+                    for attr in table_info['attributes']:
+                        if attr['name'].upper() == right_value.upper():
+                            is_valid_column = True
+                            break
+                    if is_valid_column:
+                        break
+                
+                if not is_valid_column:
+                    error_msg = self.format_error_message(312, right_token.line, 
+                                f"El nombre del atributo \"{right_value}\" no es válido.", right_token.span)
+                    return {
+                        "status": "error", 
+                        "message": "Se encontraron errores semánticos en la cláusula WHERE", 
+                        "errors": [error_msg]
+                    }
+        elif isinstance(operand, Literal) and operand.token.kind == 62:
+            right_token = operand.token
+            right_value = right_token.value
+            if not (right_value.startswith("'") and right_value.endswith("'")):
+                error_msg = self.format_error_message(205, right_token.line, 
+                            f"Error de sintaxis: el literal de texto '{right_value}' debe estar entre comillas simples.", right_token.span)
+                return {
+                    "status": "error", 
+                    "message": "Se encontraron errores de sintaxis en la cláusula WHERE", 
+                    "errors": [error_msg]
+                }
+        
         return None
     
     def validate_unquoted_literal(self, value):
@@ -1100,57 +892,41 @@ class SyntaxErrorHandler:
             
         return False
     
-    def validate_attribute_names(self, tokens):
-        is_select_query = False
-        for token_info in tokens:
-            token_type = self.get_token_type(token_info)
-            if token_type == 10:
-                is_select_query = True
-                break
-                
-        if not is_select_query:
+    def validate_attribute_names(self, tokens, tree=None):
+        if tree is None:
+            tree = build_tree(tokens)
+        if not isinstance(tree, Select):
             return None
-            
-        for i in range(len(tokens)):
-            token_info = tokens[i]
-            token_value = token_info[1][1]
-            token_type = self.get_token_type(token_info)
-            
-            if token_type == 4:
-                if '#' in token_value:
-                    is_attribute = False
-                    
-                    if i > 0:
-                        prev_token_type = self.get_token_type(tokens[i-1])
-                        prev_token_value = tokens[i-1][1][1]
-                        if prev_token_type == 10 or prev_token_value == ',':
-                            is_attribute = True
-                    
-                    if i > 0 and tokens[i-1][1][1] == '.':
-                        is_attribute = True
-                    elif i + 1 < len(tokens) and self.get_token_type(tokens[i+1]) in self.operadores_relacionales:
-                        is_attribute = True
-                    elif i + 1 < len(tokens) and tokens[i+1][1][1] == '.':
-                        is_attribute = True
-                    elif i + 1 < len(tokens):
-                        next_token_value = tokens[i+1][1][1]
-                        next_token_type = self.get_token_type(tokens[i+1])
-                        if next_token_value == ',' or next_token_type == 11:
-                            is_attribute = True
-                    elif i > 1 and (self.get_token_type(tokens[i-1]) == 14 or self.get_token_type(tokens[i-1]) == 15):
-                        is_attribute = True
-                    elif i > 2 and tokens[i-2][1][1] == '(' and self.get_token_type(tokens[i-1]) == 10:
-                        is_attribute = True
-                    elif i > 1 and self.get_token_type(tokens[i-1]) == 13:
-                        is_attribute = True
-                        
-                    if is_attribute:
-                        line = token_info[0]
-                        error_msg = self.format_error_message(318, line, f"El nombre del atributo \"{token_value}\" no es válido.")
-                        return {
-                            "status": "error", 
-                            "message": "Se encontraron errores semánticos en nombres de atributos", 
-                            "errors": [error_msg]
-                        }
+        
+        for node in walk(tree):
+            candidates = []
+            if isinstance(node, Select):
+                for column in node.columns:
+                    candidates.extend((column.table, column.column))
+                for index, table in enumerate(node.tables):
+                    last = index == len(node.tables) - 1
+                    if index > 0 or (table.alias is None and not last):
+                        candidates.append(table.name)
+                    if not last:
+                        candidates.append(table.alias)
+            elif isinstance(node, Comparison):
+                candidates.extend((node.left.table, node.left.column))
+                if isinstance(node.right, ColumnRef) and node.right.table:
+                    candidates.extend((node.right.table, node.right.column))
+            elif isinstance(node, InSubquery):
+                if node.left.table:
+                    candidates.extend((node.left.table, node.left.column))
+            elif isinstance(node, ColumnRef):
+                if node.table:
+                    candidates.extend((node.table, node.column))
+            
+            for token_info in candidates:
+                if token_info is not None and token_info.kind == 4 and '#' in token_info.value:
+                    error_msg = self.format_error_message(318, token_info.line, f"El nombre del atributo \"{token_info.value}\" no es válido.", token_info.span)
+                    return {
+                        "status": "error", 
+                        "message": "Se encontraron errores semánticos en nombres de atributos", 
+                        "errors": [error_msg]
+                    }
         
         return None
\ No newline at end of file
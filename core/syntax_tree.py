@@ -0,0 +1,380 @@
+from core.scanner_dml import relational_operators
+
+relational_kinds = frozenset(relational_operators.values())
+
+class ColumnRef:
+    __slots__ = ('table', 'column')
+
+    def __init__(self, column, table=None):
+        self.column = column
+        self.table = table
+
+    @property
+    def token(self):
+        return self.table or self.column
+
+    @property
+    def name(self):
+        if self.table:
+            return f"{self.table.value}.{self.column.value}"
+        return self.column.value
+
+    def __repr__(self):
+        return f"ColumnRef({self.name})"
+
+class Literal:
+    __slots__ = ('token',)
+
+    def __init__(self, token):
+        self.token = token
+
+    def __repr__(self):
+        return f"Literal({self.token.value})"
+
+class TableRef:
+    __slots__ = ('name', 'alias')
+
+    def __init__(self, name, alias=None):
+        self.name = name
+        self.alias = alias
+
+    def __repr__(self):
+        if self.alias:
+            return f"TableRef({self.name.value} {self.alias.value})"
+        return f"TableRef({self.name.value})"
+
+class Comparison:
+    __slots__ = ('left', 'operator', 'right')
+
+    def __init__(self, left, operator, right=None):
+        self.left = left
+        self.operator = operator
+        self.right = right
+
+    def __repr__(self):
+        return f"Comparison({self.left!r} {self.operator.value} {self.right!r})"
+
+class InSubquery:
+    __slots__ = ('left', 'query')
+
+    def __init__(self, left, query):
+        self.left = left
+        self.query = query
+
+    def __repr__(self):
+        return f"InSubquery({self.left!r} {self.query!r})"
+
+class Condition:
+    __slots__ = ('operator', 'left', 'right')
+
+    def __init__(self, operator, left, right):
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+    def __repr__(self):
+        return f"Condition({self.left!r} {self.operator.value} {self.right!r})"
+
+class Select:
+    __slots__ = ('keyword', 'distinct', 'columns', 'tables', 'where')
+
+    def __init__(self, keyword, distinct=None, columns=None, tables=None, where=None):
+        self.keyword = keyword
+        self.distinct = distinct
+        self.columns = columns or []
+        self.tables = tables or []
+        self.where = where
+
+    def __repr__(self):
+        return f"Select({self.columns!r} {self.tables!r} {self.where!r})"
+
+class ColumnDef:
+    __slots__ = ('name', 'type', 'size', 'not_null', 'primary_key')
+
+    def __init__(self, name, type_token=None, size=None, not_null=False, primary_key=False):
+        self.name = name
+        self.type = type_token
+        self.size = size
+        self.not_null = not_null
+        self.primary_key = primary_key
+
+    def __repr__(self):
+        return f"ColumnDef({self.name.value})"
+
+class Constraint:
+    __slots__ = ('name', 'kind', 'columns', 'references_table', 'references_columns')
+
+    def __init__(self, name, kind, columns=None, references_table=None, references_columns=None):
+        self.name = name
+        self.kind = kind
+        self.columns = columns or []
+        self.references_table = references_table
+        self.references_columns = references_columns or []
+
+    def __repr__(self):
+        return f"Constraint({self.kind.value} {self.columns!r})"
+
+class CreateTable:
+    __slots__ = ('name', 'columns', 'constraints')
+
+    def __init__(self, name, columns=None, constraints=None):
+        self.name = name
+        self.columns = columns or []
+        self.constraints = constraints or []
+
+    def __repr__(self):
+        return f"CreateTable({self.name.value} {self.columns!r} {self.constraints!r})"
+
+class TreeBuilder:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.kinds = [token.kind for token in tokens]
+        self.kinds.extend((None, None, None))
+        self.index = 0
+
+    def take(self, kind=None):
+        index = self.index
+        if index >= len(self.tokens) or (kind is not None and self.kinds[index] != kind):
+            return None
+        self.index = index + 1
+        return self.tokens[index]
+
+    def build(self):
+        kind = self.kinds[0]
+        if kind == 10:
+            return self.select()
+        if kind == 16:
+            return self.create_table()
+        return None
+
+    def select(self):
+        tokens = self.tokens
+        kinds = self.kinds
+        pending = []
+        node = self.select_clauses()
+        i = self.index
+        terms = []
+        operators = []
+        operator = None
+        collecting = kinds[i] == 12
+        if collecting:
+            i += 1
+
+        while True:
+            if collecting:
+                while kinds[i] == 14 or kinds[i] == 15:
+                    operator = tokens[i]
+                    i += 1
+
+                kind = kinds[i]
+                predicate = None
+                if kind == 4:
+                    left, i = self.column_ref(i)
+                    kind = kinds[i]
+                    if kind == 13 and kinds[i + 1] == 52 and kinds[i + 2] == 10:
+                        predicate = InSubquery(left, None)
+                        i += 2
+                    elif kind in relational_kinds:
+                        right, j = self.operand(i + 1)
+                        predicate = Comparison(left, tokens[i], right)
+                        i = j
+                    else:
+                        predicate = left
+                elif kind == 61 or kind == 62:
+                    predicate = Literal(tokens[i])
+                    i += 1
+
+                if predicate is not None:
+                    if terms:
+                        operators.append(operator)
+                    terms.append(predicate)
+                    if predicate.__class__ is InSubquery:
+                        pending.append((node, terms, operators, predicate))
+                        self.index = i
+                        node = self.select_clauses()
+                        i = self.index
+                        terms = []
+                        operators = []
+                        collecting = kinds[i] == 12
+                        if collecting:
+                            i += 1
+                        continue
+                    if kinds[i] == 14 or kinds[i] == 15:
+                        continue
+
+            node.where = self.condition(terms, operators)
+            if not pending:
+                self.index = i
+                return node
+            query = node
+            node, terms, operators, predicate = pending.pop()
+            predicate.query = query
+            if kinds[i] == 53:
+                i += 1
+            collecting = kinds[i] == 14 or kinds[i] == 15
+
+    def select_clauses(self):
+        tokens = self.tokens
+        kinds = self.kinds
+        i = self.index
+        node = Select(None)
+        if kinds[i] == 10:
+            node.keyword = tokens[i]
+            i += 1
+        if kinds[i] == 30:
+            node.distinct = tokens[i]
+            i += 1
+
+        columns = node.columns
+        while True:
+            kind = kinds[i]
+            if kind == 4:
+                column, i = self.column_ref(i)
+                columns.append(column)
+            elif kind == 72:
+                columns.append(ColumnRef(tokens[i]))
+                i += 1
+            else:
+                break
+            if kinds[i] != 50:
+                break
+            i += 1
+
+        if kinds[i] == 11:
+            i += 1
+            tables = node.tables
+            while kinds[i] == 4:
+                if kinds[i + 1] == 4:
+                    tables.append(TableRef(tokens[i], tokens[i + 1]))
+                    i += 2
+                else:
+                    tables.append(TableRef(tokens[i]))
+                    i += 1
+                if kinds[i] != 50:
+                    break
+                i += 1
+
+        self.index = i
+        return node
+
+    def column_ref(self, i):
+        if self.kinds[i + 1] == 51 and self.kinds[i + 2] == 4:
+            return ColumnRef(self.tokens[i + 2], self.tokens[i]), i + 3
+        return ColumnRef(self.tokens[i]), i + 1
+
+    def condition(self, terms, operators):
+        if not terms:
+            return None
+
+        disjuncts = []
+        node = terms[0]
+        for operator, term in zip(operators, terms[1:]):
+            if operator.kind == 14:
+                node = Condition(operator, node, term)
+            else:
+                disjuncts.append((operator, node))
+                node = term
+        for operator, left in reversed(disjuncts):
+            node = Condition(operator, left, node)
+        return node
+
+    def operand(self, i):
+        kind = self.kinds[i]
+        if kind == 4:
+            return self.column_ref(i)
+        if kind == 61 or kind == 62:
+            return Literal(self.tokens[i]), i + 1
+        if kind == 54:
+            node = Literal(self.tokens[i])
+            i += 1
+            if self.kinds[i] == 61 or self.kinds[i] == 62:
+                i += 1
+            if self.kinds[i] == 54:
+                i += 1
+            return node, i
+        return None, i
+
+    def create_table(self):
+        self.take(16)
+        self.take(17)
+        node = CreateTable(self.take(4))
+        if not self.take(52):
+            return node
+
+        while True:
+            if self.kinds[self.index] == 4:
+                node.columns.append(self.column_def())
+            elif self.kinds[self.index] == 22:
+                node.constraints.append(self.constraint())
+            else:
+                break
+            if not self.take(50):
+                break
+        self.take(53)
+        return node
+
+    def column_def(self):
+        kinds = self.kinds
+        node = ColumnDef(self.take(4))
+        i = self.index
+        if kinds[i] in (4, 18, 19):
+            node.type = self.tokens[i]
+            i += 1
+        if kinds[i] == 52 and kinds[i + 1] == 61 and kinds[i + 2] == 53:
+            node.size = self.tokens[i + 1]
+            i += 3
+        if kinds[i] == 20 and kinds[i + 1] == 21:
+            node.not_null = True
+            i += 2
+        if kinds[i] == 24 and kinds[i + 1] == 23:
+            node.primary_key = True
+            i += 2
+        self.index = i
+        return node
+
+    def constraint(self):
+        self.take(22)
+        name = self.take(4)
+        kind = self.take()
+        self.take(23)
+        node = Constraint(name, kind, self.names())
+        if self.take(26):
+            node.references_table = self.take(4)
+            node.references_columns = self.names()
+        return node
+
+    def names(self):
+        names = []
+        if self.take(52):
+            while self.kinds[self.index] == 4:
+                names.append(self.take())
+                if not self.take(50):
+                    break
+            self.take(53)
+        return names
+
+def predicates(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Condition):
+            stack.append(node.right)
+            stack.append(node.left)
+        elif node is not None:
+            yield node
+
+def walk(node):
+    stack = [iter((node,))]
+    while stack:
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            continue
+        yield node
+        if isinstance(node, Select):
+            stack.append(predicates(node.where))
+        elif isinstance(node, InSubquery):
+            stack.append(iter((node.query,)))
+
+def build_tree(tokens):
+    return TreeBuilder(tokens).build()